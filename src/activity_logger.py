@@ -5,11 +5,45 @@ Part 5: Extension Features - Activity Logging
 Logs all user activities to a file for audit and analysis purposes.
 """
 
+import csv
 import json
+import os
+import queue
+import threading
+from collections import Counter
 from pathlib import Path
 from typing import Union, Optional, Dict, List, Any
 from datetime import datetime
-import pandas as pd
+
+# orjson is an optional, faster drop-in for encoding and decoding log lines
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Records the background writer may fall behind by before log() blocks
+QUEUE_MAXSIZE = 10_000
+
+# Block size for reading the log backwards in read_activity_log(tail=...)
+_TAIL_BLOCK_SIZE = 8192
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    """Encode a record as one JSON line body, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record).decode('utf-8')
+        except TypeError:
+            pass  # e.g. non-string metadata keys; the stdlib handles those
+    return json.dumps(record)
+
+
+def _loads(line: Union[str, bytes]) -> Dict[str, Any]:
+    """Decode one JSON log line, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
 
 
 class ActivityLogger:
@@ -28,6 +62,13 @@ class ActivityLogger:
     auto_log_session : bool, default False
         If True, automatically logs session start and end when using
         as a context manager.
+    background : bool, default False
+        If True, records are queued and appended to the file by a daemon
+        writer thread, which writes everything queued at once. ``log``
+        then returns without touching the file; call ``flush`` before
+        reading the log back and before the program exits. At most
+        ``QUEUE_MAXSIZE`` records are held; beyond that ``log`` waits for
+        the writer instead of growing memory.
     
     Examples
     --------
@@ -37,12 +78,18 @@ class ActivityLogger:
     # Using as context manager
     >>> with ActivityLogger("logs/activity.log", auto_log_session=True) as logger:
     ...     logger.log("analysis", "Calculated summary statistics")
+    
+    # Writing off the caller's thread
+    >>> logger = ActivityLogger("logs/activity.log", background=True)
+    >>> logger.log("data_loaded", "Loaded vaccination data from CSV")
+    >>> logger.flush()
     """
     
     def __init__(self, 
                  log_file: Union[str, Path],
                  user: Optional[str] = None,
-                 auto_log_session: bool = False):
+                 auto_log_session: bool = False,
+                 background: bool = False):
         """Initialize the activity logger."""
         self.log_file = Path(log_file)
         self.user = user or "unknown"
@@ -52,6 +99,49 @@ class ActivityLogger:
         if not self.log_file.exists():
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
             self.log_file.touch()
+        
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(maxsize=QUEUE_MAXSIZE)
+            self._writer = threading.Thread(target=self._write_queued, daemon=True,
+                                            name="activity-log-writer")
+            self._writer.start()
+    
+    def _write_queued(self) -> None:
+        """Writer thread: append queued lines, draining the queue per write."""
+        while True:
+            lines = [self._queue.get()]
+            while True:
+                try:
+                    lines.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            text = ''.join(line for line in lines if line is not None)
+            try:
+                if text:
+                    with open(self.log_file, 'a', encoding='utf-8') as f:
+                        f.write(text)
+            except OSError:
+                pass  # Logging must never take the dashboard down
+            finally:
+                for _ in lines:
+                    self._queue.task_done()
+            
+            if None in lines:
+                return
+    
+    def flush(self) -> None:
+        """Block until every queued record is written (no-op when not in background mode)."""
+        if self._queue is not None and self._writer.is_alive():
+            self._queue.join()
+    
+    def close(self) -> None:
+        """Write any queued records and stop the background writer."""
+        if self._queue is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
     
     def log(self, 
             action: str, 
@@ -89,9 +179,15 @@ class ActivityLogger:
         if metadata:
             activity['metadata'] = metadata
         
+        line = _dumps(activity) + '\n'
+        
+        if self._queue is not None and self._writer.is_alive():
+            self._queue.put(line)
+            return
+        
         # Append to log file as JSON lines
         with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(activity) + '\n')
+            f.write(line)
     
     def __enter__(self):
         """Context manager entry - log session start if enabled."""
@@ -107,6 +203,7 @@ class ActivityLogger:
                         level='ERROR')
             else:
                 self.log('session_end', 'User session ended')
+        self.flush()
         return False
 
 
@@ -144,7 +241,43 @@ def log_activity(log_file: Union[str, Path],
     logger.log(action, description, level=level, metadata=metadata)
 
 
-def read_activity_log(log_file: Union[str, Path]) -> List[Dict[str, Any]]:
+def _read_tail(log_file: Path, tail: int) -> List[Dict[str, Any]]:
+    """Decode the last ``tail`` records, reading the file backwards in blocks."""
+    activities = []
+    
+    with open(log_file, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b''
+        while pos > 0 and len(activities) < tail:
+            step = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).split(b'\n')
+            # The first piece may continue in the block before this one
+            partial = lines.pop(0)
+            for line in reversed(lines):
+                _append_record(activities, line)
+                if len(activities) == tail:
+                    break
+        if pos == 0 and len(activities) < tail:
+            _append_record(activities, partial)
+    
+    activities.reverse()
+    return activities
+
+
+def _append_record(activities: List[Dict[str, Any]], line: bytes) -> None:
+    """Decode one JSON log line onto ``activities``, skipping blank or malformed lines."""
+    line = line.strip()
+    if line:
+        try:
+            activities.append(_loads(line))
+        except ValueError:
+            pass
+
+
+def read_activity_log(log_file: Union[str, Path],
+                      tail: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Read all activities from the log file.
     
@@ -152,6 +285,10 @@ def read_activity_log(log_file: Union[str, Path]) -> List[Dict[str, Any]]:
     ----------
     log_file : str or Path
         Path to the log file.
+    tail : int, optional
+        If given, return only the last ``tail`` records. The file is read
+        backwards from the end until enough records are decoded, so the
+        cost depends on ``tail`` rather than on the size of the log.
     
     Returns
     -------
@@ -162,25 +299,27 @@ def read_activity_log(log_file: Union[str, Path]) -> List[Dict[str, Any]]:
     --------
     >>> activities = read_activity_log("logs/activity.log")
     >>> print(f"Total activities: {len(activities)}")
+    >>> latest = read_activity_log("logs/activity.log", tail=20)
     """
     log_file = Path(log_file)
     
     if not log_file.exists():
         return []
     
+    if tail is not None:
+        if tail <= 0:
+            return []
+        try:
+            return _read_tail(log_file, tail)
+        except Exception:
+            return []
+    
     activities = []
     
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
+        with open(log_file, 'rb') as f:
             for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        activity = json.loads(line)
-                        activities.append(activity)
-                    except json.JSONDecodeError:
-                        # Skip malformed lines
-                        continue
+                _append_record(activities, line)
     except Exception:
         return []
     
@@ -228,26 +367,27 @@ def filter_activities(log_file: Union[str, Path],
     >>> user_activities = filter_activities("logs/activity.log", user="analyst1")
     """
     activities = read_activity_log(log_file)
-    filtered = activities
-    
-    if action:
-        filtered = [a for a in filtered if a.get('action') == action]
-    
-    if user:
-        filtered = [a for a in filtered if a.get('user') == user]
-    
-    if level:
-        filtered = [a for a in filtered if a.get('level') == level]
-    
-    if start_date:
-        filtered = [a for a in filtered 
-                   if datetime.fromisoformat(a['timestamp']) >= start_date]
-    
-    if end_date:
-        filtered = [a for a in filtered 
-                   if datetime.fromisoformat(a['timestamp']) <= end_date]
     
-    return filtered
+    # All criteria are checked in one pass; timestamps are parsed only for
+    # records that already match the field criteria
+    fields = [(key, value) for key, value in
+              (('action', action), ('user', user), ('level', level)) if value]
+    
+    def matches(activity: Dict[str, Any]) -> bool:
+        for key, value in fields:
+            if activity.get(key) != value:
+                return False
+        if start_date or end_date:
+            timestamp = datetime.fromisoformat(activity['timestamp'])
+            if start_date and timestamp < start_date:
+                return False
+            if end_date and timestamp > end_date:
+                return False
+        return True
+    
+    if not fields and not (start_date or end_date):
+        return activities
+    return [a for a in activities if matches(a)]
 
 
 def get_activity_stats(log_file: Union[str, Path]) -> Dict[str, Any]:
@@ -286,23 +426,14 @@ def get_activity_stats(log_file: Union[str, Path]) -> Dict[str, Any]:
             'date_range': None
         }
     
-    # Count actions
-    action_counts = {}
+    # One pass over the records for all three counts
+    action_counts = Counter()
+    level_counts = Counter()
+    user_counts = Counter()
     for activity in activities:
-        action = activity.get('action', 'unknown')
-        action_counts[action] = action_counts.get(action, 0) + 1
-    
-    # Count levels
-    level_counts = {}
-    for activity in activities:
-        level = activity.get('level', 'INFO')
-        level_counts[level] = level_counts.get(level, 0) + 1
-    
-    # Count users
-    user_counts = {}
-    for activity in activities:
-        user = activity.get('user', 'unknown')
-        user_counts[user] = user_counts.get(user, 0) + 1
+        action_counts[activity.get('action', 'unknown')] += 1
+        level_counts[activity.get('level', 'INFO')] += 1
+        user_counts[activity.get('user', 'unknown')] += 1
     
     # Get date range
     timestamps = [datetime.fromisoformat(a['timestamp']) for a in activities]
@@ -313,9 +444,9 @@ def get_activity_stats(log_file: Union[str, Path]) -> Dict[str, Any]:
     
     return {
         'total_activities': len(activities),
-        'action_counts': action_counts,
-        'level_counts': level_counts,
-        'user_counts': user_counts,
+        'action_counts': dict(action_counts),
+        'level_counts': dict(level_counts),
+        'user_counts': dict(user_counts),
         'date_range': date_range
     }
 
@@ -351,6 +482,9 @@ def export_log_to_csv(log_file: Union[str, Path],
     """
     Export activity log to CSV format.
     
+    Records are converted one line at a time, so memory use does not grow
+    with the size of the log.
+    
     Parameters
     ----------
     log_file : str or Path
@@ -358,48 +492,44 @@ def export_log_to_csv(log_file: Union[str, Path],
     output_file : str or Path
         Path to the output CSV file.
     include_metadata : bool, default False
-        If True, includes metadata as a JSON string column.
+        If True, adds a metadata column holding each record's metadata as
+        a JSON string (empty when a record has none).
     
     Examples
     --------
     >>> export_log_to_csv("logs/activity.log", "reports/activities.csv")
     """
-    activities = read_activity_log(log_file)
-    
-    if not activities:
-        # Create empty CSV with headers
-        df = pd.DataFrame(columns=['timestamp', 'user', 'action', 'description', 'level'])
-    else:
-        # Convert to DataFrame
-        df = pd.DataFrame(activities)
-        
-        # Handle metadata
-        if include_metadata and 'metadata' in df.columns:
-            # Convert metadata dict to JSON string
-            df['metadata'] = df['metadata'].apply(
-                lambda x: json.dumps(x) if isinstance(x, dict) else ''
-            )
-        elif 'metadata' in df.columns and not include_metadata:
-            # Drop metadata column
-            df = df.drop(columns=['metadata'])
-    
-    # Ensure standard columns exist
-    standard_cols = ['timestamp', 'user', 'action', 'description', 'level']
-    for col in standard_cols:
-        if col not in df.columns:
-            df[col] = ''
-    
-    # Reorder columns
-    cols = [c for c in standard_cols if c in df.columns]
-    if include_metadata and 'metadata' in df.columns:
-        cols.append('metadata')
-    
-    df = df[cols]
-    
-    # Export to CSV
+    log_file = Path(log_file)
     output_file = Path(output_file)
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_file, index=False)
+    
+    fieldnames = ['timestamp', 'user', 'action', 'description', 'level']
+    if include_metadata:
+        fieldnames.append('metadata')
+    
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 16) as dst:
+        writer = csv.DictWriter(dst, fieldnames=fieldnames, restval='',
+                                extrasaction='ignore', lineterminator=os.linesep)
+        writer.writeheader()
+        
+        if not log_file.exists():
+            return
+        
+        with open(log_file, 'r', encoding='utf-8') as src:
+            for line in src:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    activity = _loads(line)
+                except ValueError:
+                    # Skip malformed lines
+                    continue
+                
+                if include_metadata:
+                    metadata = activity.get('metadata')
+                    activity['metadata'] = _dumps(metadata) if isinstance(metadata, dict) else ''
+                writer.writerow(activity)
 
 
 # ==============================================================================
@@ -139,15 +139,18 @@ def filter_by_multiple_criteria(
     >>> criteria = {'country': ['UK', 'USA'], 'year': 2020}
     >>> filtered = filter_by_multiple_criteria(df, criteria)
     """
-    filtered = df.copy()
+    # Combine all conditions into one mask and index once, instead of
+    # materializing an intermediate frame per criterion
+    mask = np.ones(len(df), dtype=bool)
     
     for column, value in criteria.items():
         if isinstance(value, list):
-            filtered = filtered[filtered[column].isin(value)]
+            matches = df[column].isin(value)
         else:
-            filtered = filtered[filtered[column] == value]
+            matches = df[column] == value
+        mask &= matches.to_numpy(dtype=bool, na_value=False)
     
-    return filtered
+    return df[mask]
 
 
 def calculate_summary_stats(
@@ -204,10 +207,27 @@ def get_column_statistics(
     if columns is None:
         columns = df.select_dtypes(include=[np.number]).columns.tolist()
     
+    columns = [col for col in columns
+               if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
+    if not columns:
+        return {}
+    
+    # Each statistic is reduced over all columns in one call, instead of
+    # seven separate passes per column
+    table = df[columns].agg(['mean', 'median', 'min', 'max', 'count', 'sum', 'std'])
+    
     stats_dict = {}
     for col in columns:
-        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
-            stats_dict[col] = calculate_summary_stats(df, col)
+        col_stats = table[col]
+        stats_dict[col] = {
+            'mean': float(col_stats['mean']),
+            'median': float(col_stats['median']),
+            'min': float(col_stats['min']),
+            'max': float(col_stats['max']),
+            'count': int(col_stats['count']),
+            'sum': float(col_stats['sum']),
+            'std': float(col_stats['std'])
+        }
     
     return stats_dict
 
@@ -218,7 +238,8 @@ def group_and_aggregate(
     agg_column: str,
     agg_func: Union[str, List[str]] = 'sum',
     sort_by: Optional[str] = None,
-    ascending: bool = True
+    ascending: bool = True,
+    backend: str = 'pandas'
 ) -> pd.DataFrame:
     """
     Group DataFrame and apply aggregation function.
@@ -237,13 +258,30 @@ def group_and_aggregate(
         Column to sort results by
     ascending : bool, default True
         Sort order
+    backend : str, default 'pandas'
+        'pandas' or 'polars'. The polars backend runs a single aggregation
+        function as one lazy query; it falls back to pandas when polars
+        is not installed or the aggregation isn't supported there.
 
     Returns
     -------
     pd.DataFrame
         Grouped and aggregated DataFrame
     """
-    grouped = df.groupby(group_by)[agg_column].agg(agg_func).reset_index()
+    if backend not in ('pandas', 'polars'):
+        raise ValueError(f"Unknown backend: {backend}")
+    
+    if backend == 'polars':
+        grouped = _group_and_aggregate_polars(df, group_by, agg_column, agg_func,
+                                              sort_by, ascending)
+        if grouped is not None:
+            return grouped
+    
+    grouped = _group_and_aggregate_bincount(df, group_by, agg_column, agg_func)
+    
+    if grouped is None:
+        # observed=True keeps unused categories of categorical keys out of the result
+        grouped = df.groupby(group_by, observed=True)[agg_column].agg(agg_func).reset_index()
     
     if sort_by and sort_by in grouped.columns:
         grouped = grouped.sort_values(sort_by, ascending=ascending)
@@ -262,6 +300,110 @@ def group_and_aggregate(
     return grouped
 
 
+_BINCOUNT_AGGS = ('sum', 'mean', 'count')
+
+
+def _group_and_aggregate_bincount(
+    df: pd.DataFrame,
+    group_by: Union[str, List[str]],
+    agg_column: str,
+    agg_func: Union[str, List[str]]
+) -> Optional[pd.DataFrame]:
+    """
+    NumPy implementation of a single-key, single-function aggregation.
+
+    The key is factorized once and sums, means and counts are a single
+    ``np.bincount`` pass over the codes, with no per-group slicing or
+    sorting of the rows. Returns None (use pandas) for other functions,
+    multiple keys or functions, non-NumPy dtypes, or float columns
+    containing NaN.
+    """
+    if not isinstance(group_by, str) or not isinstance(agg_func, str):
+        return None
+    if agg_func not in _BINCOUNT_AGGS or df.empty:
+        return None
+    
+    values = df[agg_column]
+    if not isinstance(values.dtype, np.dtype) or values.dtype.kind not in 'iuf':
+        return None
+    values = values.to_numpy()
+    if values.dtype.kind == 'f' and np.isnan(values).any():
+        return None
+    
+    try:
+        codes, uniques = pd.factorize(df[group_by], sort=True)
+    except TypeError:
+        return None  # Unorderable mixed-type keys
+    
+    # Missing keys (code -1) are dropped, as in groupby
+    present = codes >= 0
+    if not present.all():
+        codes, values = codes[present], values[present]
+        if len(codes) == 0:
+            return None
+    
+    n_groups = len(uniques)
+    counts = np.bincount(codes, minlength=n_groups)
+    
+    if agg_func == 'count':
+        result = counts
+    else:
+        # Integer totals are exact in float64 below 2**53
+        if values.dtype.kind in 'iu' and np.abs(values, dtype=np.float64).sum() >= 2 ** 53:
+            return None
+        totals = np.bincount(codes, weights=values, minlength=n_groups)
+        if agg_func == 'mean':
+            result = totals / counts
+        elif values.dtype.kind in 'iu':
+            result = totals.astype(values.dtype)
+        else:
+            result = totals
+    
+    return pd.DataFrame({group_by: uniques, agg_column: result})
+
+
+_POLARS_AGGS = ('sum', 'mean', 'median', 'min', 'max', 'count', 'std')
+
+
+def _group_and_aggregate_polars(
+    df: pd.DataFrame,
+    group_by: Union[str, List[str]],
+    agg_column: str,
+    agg_func: Union[str, List[str]],
+    sort_by: Optional[str],
+    ascending: bool
+) -> Optional[pd.DataFrame]:
+    """
+    Polars implementation of group_and_aggregate.
+
+    Returns None when polars is unavailable or the aggregation isn't one of
+    the supported single functions, so the caller can use pandas instead.
+    """
+    if not isinstance(agg_func, str) or agg_func not in _POLARS_AGGS:
+        return None
+    
+    try:
+        import polars as pl
+    except ImportError:
+        return None
+    
+    keys = [group_by] if isinstance(group_by, str) else list(group_by)
+    
+    try:
+        lazy = pl.from_pandas(df[keys + [agg_column]]).lazy()
+    except ImportError:
+        return None  # Conversion of some dtypes needs pyarrow
+    
+    expr = getattr(pl.col(agg_column), agg_func)()
+    query = lazy.group_by(keys).agg(expr).sort(keys)
+    if sort_by and sort_by in keys + [agg_column]:
+        query = query.sort(sort_by, descending=not ascending)
+    
+    result = query.collect()
+    grouped = pd.DataFrame(result.to_dict(as_series=False))
+    return grouped.set_index(group_by)
+
+
 def calculate_trends(
     df: pd.DataFrame,
     date_column: str,
@@ -311,6 +453,67 @@ def calculate_trends(
     return trends
 
 
+def calculate_period_trends(
+    df: pd.DataFrame,
+    time_column: str,
+    value_column: str,
+    group_column: Optional[str] = None,
+    agg_func: str = 'sum'
+) -> pd.DataFrame:
+    """
+    Aggregate a value per period and compute period-over-period trends.
+
+    Everything is done with grouped pandas operations (no Python loop over
+    groups): values are aggregated per (group, period), then changes,
+    growth rates and per-period ranks are computed on the grouped result.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame with time series data
+    time_column : str
+        Column holding the period (e.g. year). Datetime columns are
+        bucketed by calendar month.
+    value_column : str
+        Numeric column to analyze
+    group_column : str, optional
+        Column identifying separate series (e.g. country)
+    agg_func : str, default 'sum'
+        Aggregation applied to the values of each period
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per (group, period) with the aggregated value and:
+        - change: difference from the previous period of the same group
+        - growth_rate: percentage change from the previous period
+        - rank: dense rank of the group within the period, largest first
+          (only when group_column is given)
+    """
+    time_key = df[time_column]
+    if pd.api.types.is_datetime64_any_dtype(time_key):
+        time_key = time_key.dt.to_period('M')
+    
+    keys = [time_key] if group_column is None else [df[group_column], time_key]
+    periods = (df.groupby(keys, observed=True, sort=True)[value_column]
+               .agg(agg_func)
+               .reset_index())
+    
+    if group_column is None:
+        values = periods[value_column]
+        periods['change'] = values.diff()
+        periods['growth_rate'] = values.pct_change() * 100
+    else:
+        by_group = periods.groupby(group_column, observed=True)[value_column]
+        periods['change'] = by_group.diff()
+        periods['growth_rate'] = by_group.pct_change() * 100
+        periods['rank'] = (periods.groupby(time_column, observed=True)[value_column]
+                           .rank(method='dense', ascending=False)
+                           .astype('Int64'))
+    
+    return periods
+
+
 def calculate_growth_rate(
     df: pd.DataFrame,
     value_column: str,
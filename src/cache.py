@@ -0,0 +1,107 @@
+"""
+Dataset Cache - Feather Cache Files
+
+This module keeps a binary copy of each loaded dataset so later loads
+skip parsing the original file:
+- Feather: an uncompressed file under data/.cache keyed by the source path,
+  its modification time and size, and the loader variant (fastest to read back)
+- A cache file is only used for the exact source state it was built from
+- Requires pyarrow; without it datasets are always parsed from source
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Callable, Optional, Union
+import pandas as pd
+
+
+# Directory holding Feather copies of loaded datasets
+CACHE_DIR = Path("data") / ".cache"
+
+
+def _default_loader(path: Path) -> Callable[[Path], pd.DataFrame]:
+    """Pick the dataset loader for a file based on its suffix."""
+    from src.main import load_dataset, load_json_dataset
+    return load_json_dataset if path.suffix.lower() == '.json' else load_dataset
+
+
+def _cache_key(path: Path, variant: str) -> str:
+    """Hash of a source file's resolved path and the loader variant."""
+    return hashlib.md5(f"{path.resolve()}|{variant}".encode('utf-8')).hexdigest()
+
+
+def _cache_path(path: Path, cache_dir: Path, variant: str = "default") -> Path:
+    """
+    Feather cache file for a source file.
+
+    The name combines a hash of the resolved path and loader variant with
+    the source's modification time (ns) and size, so a cache file is only
+    ever matched by the exact file state it was built from, even if the
+    source is replaced by a file with an older timestamp.
+    """
+    stat = path.stat()
+    return cache_dir / f"{_cache_key(path, variant)}-{stat.st_mtime_ns}-{stat.st_size}.feather"
+
+
+def load_or_feather(path: Union[str, Path],
+                    loader: Optional[Callable[[Path], pd.DataFrame]] = None,
+                    cache_dir: Optional[Union[str, Path]] = None,
+                    variant: str = "default") -> pd.DataFrame:
+    """
+    Load a dataset, reading its Feather cache file when it is up to date.
+
+    The copy is an uncompressed Feather file in a shared cache directory,
+    which reads back quickly and leaves the source directory untouched.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path to the source dataset (CSV or JSON).
+    loader : callable, optional
+        Function that parses the source file into a DataFrame. Defaults to
+        load_json_dataset for .json files and load_dataset otherwise.
+    cache_dir : str or pathlib.Path, optional
+        Directory for cache files. Defaults to ``CACHE_DIR``.
+    variant : str, default "default"
+        Name of the loader configuration (e.g. "fast" for the Arrow-based
+        CSV reader). Frames built by different loaders are cached apart.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The loaded data.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the source file does not exist.
+
+    Examples
+    --------
+    >>> df = load_or_feather("data/sample_vaccination_data.csv")
+    """
+    path = Path(path)
+    
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    
+    cache_dir = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+    cache = _cache_path(path, cache_dir, variant)
+    if cache.exists():
+        try:
+            return pd.read_feather(cache)
+        except Exception:
+            pass  # Unreadable cache or no Feather engine: parse the source
+    
+    df = (loader or _default_loader(path))(path)
+    
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        # Drop copies built from earlier versions of the same source
+        for stale in cache_dir.glob(f"{_cache_key(path, variant)}-*.feather"):
+            stale.unlink()
+        df.reset_index(drop=True).to_feather(cache, compression='uncompressed')
+    except Exception:
+        pass  # Caching is best effort (no pyarrow, read-only dir, odd dtypes)
+    
+    return df
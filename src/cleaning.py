@@ -13,7 +13,6 @@ This module provides functions for cleaning and structuring public health data:
 from typing import Union, Optional, Dict, List, Any
 import pandas as pd
 import numpy as np
-from scipy import stats
 
 
 def detect_missing_values(df: pd.DataFrame) -> pd.DataFrame:
@@ -33,17 +32,14 @@ def detect_missing_values(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=['column', 'missing_count', 'missing_percentage'])
     
-    missing_data = []
-    for col in df.columns:
-        missing_count = df[col].isna().sum()
-        missing_pct = (missing_count / len(df)) * 100
-        missing_data.append({
-            'column': col,
-            'missing_count': missing_count,
-            'missing_percentage': round(missing_pct, 2)
-        })
+    # One block-wise null scan for all columns instead of one per column
+    missing_counts = df.isna().sum().to_numpy(dtype=np.int64)
     
-    return pd.DataFrame(missing_data)
+    return pd.DataFrame({
+        'column': df.columns.tolist(),
+        'missing_count': missing_counts,
+        'missing_percentage': np.round(missing_counts / len(df) * 100, 2)
+    })
 
 
 def handle_missing_values(
@@ -86,15 +82,13 @@ def handle_missing_values(
     if strategy == 'drop':
         df_copy = df_copy.dropna(subset=columns)
     
-    elif strategy == 'mean':
-        for col in columns:
-            if pd.api.types.is_numeric_dtype(df_copy[col]):
-                df_copy[col] = df_copy[col].fillna(df_copy[col].mean())
-    
-    elif strategy == 'median':
-        for col in columns:
-            if pd.api.types.is_numeric_dtype(df_copy[col]):
-                df_copy[col] = df_copy[col].fillna(df_copy[col].median())
+    elif strategy in ('mean', 'median'):
+        # Compute all fill values in one reduction and fill every numeric
+        # column in a single block-wise fillna
+        numeric = [col for col in columns if pd.api.types.is_numeric_dtype(df_copy[col])]
+        if numeric:
+            fills = getattr(df_copy[numeric], strategy)()
+            df_copy.fillna(fills, inplace=True)
     
     elif strategy == 'mode':
         for col in columns:
@@ -143,11 +137,6 @@ def detect_duplicates(
     pd.DataFrame
         DataFrame containing only the duplicate rows
     """
-    if subset is None:
-        duplicates_mask = df.duplicated(keep=False)
-    else:
-        duplicates_mask = df.duplicated(subset=subset, keep=False)
-    
     # Return duplicates, excluding the first occurrence
     return df[df.duplicated(subset=subset, keep='first')]
 
@@ -311,6 +300,8 @@ def detect_outliers(
         outliers = (df[column] < lower_bound) | (df[column] > upper_bound)
     
     elif method == 'zscore':
+        # scipy.stats is slow to import; load it only when z-scores are needed
+        from scipy import stats
         z_scores = np.abs(stats.zscore(df[column].dropna()))
         # Create a series with the same index as df
         outliers = pd.Series(False, index=df.index)
@@ -470,6 +461,44 @@ class DataCleaner:
         self.operations.append(f"remove_duplicates(keep='{keep}')")
         return self
     
+    def fused_pipeline(
+        self,
+        drop_dup: bool = True,
+        drop_na: bool = True
+    ) -> 'DataCleaner':
+        """
+        Remove duplicate rows and rows with missing values in one pass (chainable).
+        
+        Equivalent to ``remove_duplicates().handle_missing(strategy='drop')``,
+        but both row masks are computed on the current data and combined, so
+        the frame is filtered once instead of being copied per step.
+        
+        Parameters
+        ----------
+        drop_dup : bool, default True
+            Remove duplicate rows, keeping the first occurrence
+        drop_na : bool, default True
+            Remove rows with any missing value
+        
+        Returns
+        -------
+        DataCleaner
+            Self for method chaining
+        """
+        keep = np.ones(len(self.df), dtype=bool)
+        
+        if drop_dup:
+            keep &= ~self.df.duplicated().to_numpy()
+            self.operations.append("remove_duplicates(keep='first')")
+        
+        if drop_na:
+            keep &= ~self.df.isna().any(axis=1).to_numpy()
+            self.operations.append("handle_missing(strategy='drop')")
+        
+        if not keep.all():
+            self.df = self.df.iloc[np.flatnonzero(keep)]
+        return self
+    
     def convert_column_type(
         self,
         column: str,
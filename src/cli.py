@@ -9,28 +9,77 @@ This module provides CLI functions for user interaction:
 - Integration with data loading, cleaning, and analysis
 """
 
-from typing import Optional, List, Dict, Any, Callable
+import logging
+import os
+import re
+import sys
+from typing import Optional, List, Dict, Any, Callable, FrozenSet, Iterable, Tuple, Union
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime
+from functools import lru_cache
 
 from src.main import load_dataset, load_json_dataset, load_to_database, read_from_database
+from src.fast_io import fast_io_enabled
 from src.cleaning import DataCleaner
 from src.analysis import DataAnalyzer
 
 
+log = logging.getLogger(__name__)
+
+# Widest a text cell may render in table output before it is truncated
+MAX_COL_WIDTH = 50
+
+# Most columns rendered in table output; wider frames show the first and
+# last half with a "..." column between them
+MAX_DISPLAY_COLS = 20
+
+# Input patterns checked before conversion so bad input is rejected
+# without raising and catching ValueError
+_INT_RE = re.compile(r'^[+-]?\d+$')
+_FLOAT_RE = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$')
+
+# ANSI sequence: clear the screen and move the cursor home
+_CLEAR = '\x1b[2J\x1b[H'
+
+
 def clear_screen():
-    """Clear the terminal screen."""
-    import os
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """
+    Clear the terminal screen.
+    
+    Writes the ANSI clear sequence directly instead of spawning a shell.
+    Legacy Windows consoles without VT support (anything outside Windows
+    Terminal) still fall back to ``cls``. Does nothing when stdout is not
+    a terminal, so piped or logged output isn't filled with escape codes.
+    """
+    if not sys.stdout.isatty():
+        return
+    if os.name == 'nt' and not os.environ.get('WT_SESSION'):
+        os.system('cls')
+    else:
+        sys.stdout.write(_CLEAR)
+        sys.stdout.flush()
+
+
+@lru_cache(maxsize=128)
+def _header_text(title: str) -> str:
+    """Build the header block for a title (cached, titles repeat every turn)."""
+    rule = "=" * 70
+    return f"\n{rule}\n {title}\n{rule}\n"
+
+
+@lru_cache(maxsize=128)
+def _menu_text(title: str, options: Tuple[str, ...]) -> str:
+    """Build the full menu block for a title and options (cached)."""
+    lines = [f"  {i}. {option}" for i, option in enumerate(options, 1)]
+    lines.append("  0. Back/Exit")
+    return _header_text(title) + "\n" + "\n".join(lines) + "\n"
 
 
 def print_header(title: str):
     """Print a formatted header."""
-    print("\n" + "="*70)
-    print(f" {title}")
-    print("="*70 + "\n")
+    print(_header_text(title))
 
 
 def print_menu(title: str, options: List[str]):
@@ -44,11 +93,19 @@ def print_menu(title: str, options: List[str]):
     options : list of str
         List of menu options
     """
-    print_header(title)
-    for i, option in enumerate(options, 1):
-        print(f"  {i}. {option}")
-    print(f"  0. Back/Exit")
-    print()
+    print(_menu_text(title, tuple(options)))
+
+
+def print_numbered(items: Iterable[Any]):
+    """
+    Print items as a numbered list ("  1. item"), in a single write.
+    
+    Parameters
+    ----------
+    items : iterable
+        Items to list, e.g. column names
+    """
+    sys.stdout.write("".join(f"  {i}. {item}\n" for i, item in enumerate(items, 1)))
 
 
 def get_user_choice(max_choice: int) -> int:
@@ -67,16 +124,19 @@ def get_user_choice(max_choice: int) -> int:
     """
     while True:
         try:
-            choice = int(input("Enter your choice: "))
-            if 0 <= choice <= max_choice:
-                return choice
-            else:
-                print(f"Please enter a number between 0 and {max_choice}")
-        except ValueError:
-            print("Invalid input. Please enter a number.")
+            user_input = input("Enter your choice: ").strip()
         except KeyboardInterrupt:
             print("\n\nExiting...")
             return 0
+        
+        if not _INT_RE.match(user_input):
+            print("Invalid input. Please enter a number.")
+            continue
+        
+        choice = int(user_input)
+        if 0 <= choice <= max_choice:
+            return choice
+        print(f"Please enter a number between 0 and {max_choice}")
 
 
 def get_user_input(prompt: str, input_type: str = "string") -> Any:
@@ -103,11 +163,17 @@ def get_user_input(prompt: str, input_type: str = "string") -> Any:
                 return None
             
             if input_type == "int":
+                if not _INT_RE.match(user_input):
+                    print("Invalid int. Please try again.")
+                    continue
                 return int(user_input)
             elif input_type == "float":
+                if not _FLOAT_RE.match(user_input):
+                    print("Invalid float. Please try again.")
+                    continue
                 return float(user_input)
             elif input_type == "date":
-                return datetime.strptime(user_input, "%Y-%m-%d")
+                return datetime.fromisoformat(user_input)
             else:
                 return user_input
         except ValueError:
@@ -136,19 +202,68 @@ def display_dataframe(df: pd.DataFrame, title: str = "Data", max_rows: int = 20)
         print("No data available.\n")
         return
     
-    print(f"Total records: {len(df)}")
+    n_rows = len(df)
+    print(f"Total records: {n_rows}")
     print(f"Columns: {', '.join(df.columns)}\n")
     
-    if len(df) > max_rows:
+    if n_rows > max_rows:
         print(f"Showing first {max_rows} rows:\n")
-        print(df.head(max_rows).to_string(index=False))
-        print(f"\n... and {len(df) - max_rows} more rows")
+        # Positional slice: only the displayed rows are taken, no reindexing
+        print(_format_rows(df.iloc[:max_rows]))
+        print(f"\n... and {n_rows - max_rows} more rows")
     else:
-        print(df.to_string(index=False))
+        print(_format_rows(df))
     
     print()
 
 
+def _format_rows(df: pd.DataFrame, max_col_width: int = MAX_COL_WIDTH,
+                 max_cols: int = MAX_DISPLAY_COLS) -> str:
+    """
+    Render DataFrame rows as text, truncating long text cells.
+    
+    For larger tables, text columns are sliced to just over
+    ``max_col_width`` characters before rendering so pandas does not
+    format the full contents of long free-text cells. Frames wider than
+    ``max_cols`` are truncated horizontally, and only the columns that
+    will be shown are sliced or formatted.
+    
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Rows to render
+    max_col_width : int
+        Maximum rendered width of a cell
+    max_cols : int
+        Maximum number of columns rendered
+    
+    Returns
+    -------
+    str
+        Table text without the index
+    """
+    n_cols = df.shape[1]
+    if n_cols > max_cols:
+        # Same split pandas uses when truncating horizontally
+        half = max_cols // 2
+        shown = set(df.columns[:half]) | set(df.columns[n_cols - half:])
+    else:
+        shown = set(df.columns)
+    
+    if df.shape[0] * min(n_cols, max_cols) >= 1000:
+        long_cols = {}
+        for col in df.select_dtypes(include=['object', 'string']).columns:
+            if col not in shown:
+                continue
+            text = df[col].astype(str)
+            if text.str.len().max() > max_col_width:
+                long_cols[col] = text.str.slice(0, max_col_width + 3)
+        if long_cols:
+            df = df.assign(**long_cols)
+    
+    return df.to_string(index=False, max_colwidth=max_col_width, max_cols=max_cols)
+
+
 def display_summary_stats(stats: Dict[str, float], title: str = "Summary Statistics"):
     """
     Display summary statistics in a formatted way.
@@ -213,6 +328,8 @@ def plot_bar_chart(
     ylabel : str
         Y-axis label
     """
+    import matplotlib.pyplot as plt
+    
     plt.figure(figsize=(10, 6))
     plt.bar(df[x_column], df[y_column])
     plt.title(title)
@@ -249,6 +366,8 @@ def plot_line_chart(
     ylabel : str
         Y-axis label
     """
+    import matplotlib.pyplot as plt
+    
     plt.figure(figsize=(10, 6))
     plt.plot(df[x_column], df[y_column], marker='o')
     plt.title(title)
@@ -277,6 +396,8 @@ def plot_grouped_bar_chart(
     ylabel : str
         Y-axis label
     """
+    import matplotlib.pyplot as plt
+    
     plt.figure(figsize=(10, 6))
     df.plot(kind='bar', figsize=(10, 6))
     plt.title(title)
@@ -288,6 +409,37 @@ def plot_grouped_bar_chart(
     plt.show()
 
 
+def save_chart(fig, output_path: Path, dpi: Optional[int] = None) -> bool:
+    """
+    Save a matplotlib figure to a file.
+    
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to save
+    output_path : Path
+        Destination file; parent directories are created if needed
+    dpi : int, optional
+        Resolution to save at. Defaults to the figure's own dpi; the
+        figure itself is left unchanged.
+    
+    Returns
+    -------
+    bool
+        True if the chart was saved, False otherwise
+    """
+    output_path = Path(output_path)
+    
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fig.savefig(output_path, dpi=dpi if dpi is not None else 'figure',
+                    bbox_inches='tight')
+        return True
+    except Exception as e:
+        log.error("Failed to save chart %s: %s", output_path, e)
+        return False
+
+
 def confirm_action(message: str = "Continue?") -> bool:
     """
     Ask user for confirmation.
@@ -331,8 +483,16 @@ class CLISession:
         self.df_filtered: Optional[pd.DataFrame] = None
         self.data_name: str = "No data loaded"
         self.filters_applied: List[str] = []
-    
-    def load_data(self, df: pd.DataFrame, name: str):
+        self.fast_io: bool = fast_io_enabled()
+        self.source: Optional[Tuple[str, int, int]] = None
+        self._col_set: FrozenSet[str] = frozenset()
+        self._numeric_cols: Tuple[str, ...] = ()
+        self.version: int = 0
+        self._cache: Dict[Any, Any] = {}
+        self._filter_index: Dict[str, Dict[Any, np.ndarray]] = {}
+        self._sorted_idx: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    
+    def load_data(self, df: pd.DataFrame, name: str, source: Optional[Tuple[str, int, int]] = None):
         """
         Load data into the session.
         
@@ -342,16 +502,90 @@ class CLISession:
             Data to load
         name : str
             Name/description of the data
+        source : tuple, optional
+            Signature of the file the data was read from, as returned by
+            ``source_signature``; None for data not read from a file
         """
+        self.source = source
         self.df = df.copy()
-        self.df_filtered = df.copy()
+        self._categoricalize()
+        self.df_filtered = self.df.copy()
+        self._refresh_columns(self.df_filtered)
         self.data_name = name
         self.filters_applied = []
+        self._bump_version()
+    
+    def _categoricalize(self, df: Optional[pd.DataFrame] = None,
+                        max_ratio: float = 0.05,
+                        min_categories: int = 50) -> Optional[pd.DataFrame]:
+        """
+        Convert low-cardinality text columns to the category dtype.
+        
+        Columns such as country or region repeat a handful of values, so
+        storing them as categories makes equality filters, ``isin`` and
+        groupby work on integer codes instead of Python strings. Columns
+        whose values are all distinct (e.g. IDs) are left alone.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame, optional
+            Frame to convert in place. Defaults to the loaded data; pass
+            e.g. the output of a cleaning step to convert that instead.
+        max_ratio : float
+            Convert columns with at most this fraction of distinct values
+        min_categories : int
+            Columns with at most this many distinct values are always
+            converted, however few rows there are
+        
+        Returns
+        -------
+        pd.DataFrame or None
+            The converted frame
+        """
+        df = self.df if df is None else df
+        if df is None or df.empty:
+            return df
+        
+        n_rows = len(df)
+        limit = max(min_categories, n_rows * max_ratio)
+        for col in df.select_dtypes(include=['object', 'string']).columns:
+            n_unique = df[col].nunique(dropna=False)
+            if n_unique <= limit and n_unique < n_rows:
+                df[col] = df[col].astype('category')
+        return df
+    
+    @staticmethod
+    def source_signature(path: Union[str, Path]) -> Tuple[str, int, int]:
+        """Resolved path, modification time and size of a data file."""
+        path = Path(path).resolve()
+        stat = path.stat()
+        return str(path), stat.st_mtime_ns, stat.st_size
+    
+    def is_loaded_from(self, path: Union[str, Path]) -> bool:
+        """Check whether the loaded data came from this file, unchanged since."""
+        try:
+            return self.has_data() and self.source == self.source_signature(path)
+        except OSError:
+            return False
     
     def has_data(self) -> bool:
         """Check if data is loaded."""
         return self.df is not None and not self.df.empty
     
+    def has_column(self, column: str) -> bool:
+        """Check if the current data has a column (plain set lookup)."""
+        return column in self._col_set
+    
+    @property
+    def numeric_cols(self) -> Tuple[str, ...]:
+        """Numeric column names of the current data, cached until its schema changes."""
+        return self._numeric_cols
+    
+    def _refresh_columns(self, df: pd.DataFrame):
+        """Record the column names and numeric columns of the current data."""
+        self._col_set = frozenset(df.columns)
+        self._numeric_cols = tuple(df.select_dtypes(include=['number']).columns)
+    
     def apply_filter(self, filtered_df: pd.DataFrame, filter_description: str):
         """
         Apply a filter to the current data.
@@ -363,14 +597,184 @@ class CLISession:
         filter_description : str
             Description of the filter applied
         """
+        # Row filters keep the columns and dtypes, so the cached column
+        # lists only need rebuilding if the filter also changed the columns
+        if self._col_set != frozenset(filtered_df.columns):
+            self._refresh_columns(filtered_df)
         self.df_filtered = filtered_df
         self.filters_applied.append(filter_description)
+        self._bump_version()
+    
+    def set_current_data(self, df: pd.DataFrame, categoricalize: bool = False):
+        """
+        Replace the current data, e.g. with the result of a cleaning step.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            New current data
+        categoricalize : bool, default False
+            If True, first convert the frame's low-cardinality text columns
+            to the category dtype, as load_data does
+        """
+        if categoricalize:
+            self._categoricalize(df)
+        self.df_filtered = df
+        self._refresh_columns(df)
+        self._bump_version()
     
     def reset_filters(self):
         """Reset all filters to original data."""
         if self.df is not None:
             self.df_filtered = self.df.copy()
+            self._refresh_columns(self.df_filtered)
             self.filters_applied = []
+            self._bump_version()
+    
+    def _bump_version(self):
+        """Mark the current data as changed and drop cached results."""
+        self.version += 1
+        self._cache.clear()
+        self._filter_index.clear()
+        self._sorted_idx.clear()
+    
+    def _column_index(self, column: str) -> Dict[Any, np.ndarray]:
+        """
+        Map each value of a column to the row positions holding it.
+        
+        Built once per column with a single factorize + sort of the codes,
+        so later value listings and equality filters need no column scan.
+        Missing values are left out.
+        """
+        index = self._filter_index.get(column)
+        if index is None:
+            codes, uniques = pd.factorize(self.get_current_data()[column])
+            order = np.argsort(codes, kind='stable')
+            sorted_codes = codes[order]
+            bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+            starts = np.concatenate(([0], bounds)) if len(codes) else bounds
+            index = {
+                uniques[code]: rows
+                for code, rows in zip(sorted_codes[starts], np.split(order, bounds))
+                if code >= 0
+            }
+            self._filter_index[column] = index
+        return index
+    
+    def unique_values(self, column: str) -> List[Any]:
+        """
+        Distinct non-missing values of a column.
+        
+        Categorical columns list the categories that occur, in category
+        order, read from their integer codes. Other columns list values in
+        order of appearance.
+        """
+        series = self.get_current_data()[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            present = np.bincount(codes[codes >= 0],
+                                  minlength=len(series.cat.categories)) > 0
+            return series.cat.categories[present].tolist()
+        return list(self._column_index(column))
+    
+    def _sorted_index(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sorted non-missing values of a numeric column and their row positions.
+        
+        Built once per column and data version, so range lookups are a
+        binary search instead of comparisons over the whole column.
+        """
+        entry = self._sorted_idx.get(column)
+        if entry is None:
+            values = self.get_current_data()[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            order = np.argsort(values, kind='stable')
+            # NaN sorts last; drop it so it never falls inside a range
+            order = order[:len(values) - int(np.isnan(values).sum())]
+            entry = (values[order], order)
+            self._sorted_idx[column] = entry
+        return entry
+    
+    def value_range(self, column: str) -> Optional[Tuple[Any, Any]]:
+        """
+        Minimum and maximum of a numeric column, or None if it has no values.
+        
+        The values are taken from the column itself, so they keep its dtype
+        (an integer column gives integers, not floats).
+        """
+        _, order = self._sorted_index(column)
+        if len(order) == 0:
+            return None
+        series = self.get_current_data()[column]
+        return series.iloc[order[0]], series.iloc[order[-1]]
+    
+    def rows_in_range(self, column: str, min_value: Optional[float] = None,
+                      max_value: Optional[float] = None) -> pd.DataFrame:
+        """
+        Rows of the current data whose column lies within [min_value, max_value].
+        
+        Parameters
+        ----------
+        column : str
+            Numeric column to filter on
+        min_value : float, optional
+            Inclusive lower bound
+        max_value : float, optional
+            Inclusive upper bound
+        
+        Returns
+        -------
+        pd.DataFrame
+            Matching rows, in their original order
+        """
+        sorted_values, order = self._sorted_index(column)
+        lo = 0 if min_value is None else np.searchsorted(sorted_values, min_value, side='left')
+        hi = len(order) if max_value is None else np.searchsorted(sorted_values, max_value, side='right')
+        return self.get_current_data().take(np.sort(order[lo:hi]))
+    
+    def rows_matching(self, column: str, value: Any) -> pd.DataFrame:
+        """
+        Rows of the current data where a column equals a value.
+        
+        Parameters
+        ----------
+        column : str
+            Column to match on
+        value : Any
+            Value to look up
+        
+        Returns
+        -------
+        pd.DataFrame
+            Matching rows, in their original order
+        """
+        rows = self._column_index(column).get(value, np.empty(0, dtype=np.intp))
+        return self.get_current_data().take(rows)
+    
+    def cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a cached result for the current data, computing it once.
+        
+        Results are kept until the data changes (load, filter, reset or
+        set_current_data), so menus revisited on unchanged data don't
+        rescan the frame.
+        
+        Parameters
+        ----------
+        key : str
+            Name of the cached result
+        compute : callable
+            Zero-argument function producing the result
+        
+        Returns
+        -------
+        Any
+            The cached or freshly computed result
+        """
+        # id() guards against df_filtered being reassigned directly
+        cache_key = (key, self.version, id(self.df_filtered))
+        if cache_key not in self._cache:
+            self._cache[cache_key] = compute()
+        return self._cache[cache_key]
     
     def get_current_data(self) -> pd.DataFrame:
         """Get the current (filtered) data."""
@@ -423,7 +827,9 @@ def export_to_csv(df: pd.DataFrame, default_filename: str = "export.csv"):
         filename += '.csv'
     
     try:
-        df.to_csv(filename, index=False)
+        # Streamed in row chunks instead of formatted in one block
+        from src.fast_export import stream_to_csv
+        stream_to_csv(df, filename)
         print(f"\n[SUCCESS] Data exported to {filename}")
     except Exception as e:
         print(f"\n[ERROR] Failed to export: {e}")
@@ -4,16 +4,60 @@ CRUD (Create, Read, Update, Delete) operations for database management.
 Part 5: Extension Features - Database CRUD Operations
 """
 
+import sqlite3
+import time
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Union, Optional, Dict, List, Any
+from typing import Union, Optional, Dict, List, Any, Tuple, FrozenSet, Iterable, Callable
 import pandas as pd
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event, inspect, text, MetaData, Table
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+
+@lru_cache(maxsize=32)
+def _cached_engine(path_str: str) -> Engine:
+    """
+    Create the engine for a resolved database path (cached).
+    
+    The engine keeps SQLAlchemy's default SQLite pool (QueuePool), so each
+    checkout gets a connection of its own: an open transaction, such as a
+    BatchInserter's, is never shared with unrelated reads and writes.
+    
+    Each connection runs in WAL mode with synchronous=NORMAL, so the many
+    small commits made by create_record/update_record don't each wait for
+    a full fsync. Its page cache is raised to 64 MB, which stays warm
+    while the pool reuses the connection.
+    
+    Parameters
+    ----------
+    path_str : str
+        Resolved path to the SQLite database.
+    
+    Returns
+    -------
+    Engine
+        SQLAlchemy engine instance.
+    """
+    engine = create_engine(f'sqlite:///{path_str}')
+    
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+    
+    return engine
 
 
 def _get_engine(db_path: Union[str, Path]) -> Engine:
     """
-    Create and return a database engine.
+    Return the database engine for a path, reusing it across calls.
     
     Parameters
     ----------
@@ -25,14 +69,128 @@ def _get_engine(db_path: Union[str, Path]) -> Engine:
     Engine
         SQLAlchemy engine instance.
     """
-    db_path = Path(db_path)
-    return create_engine(f'sqlite:///{db_path}')
+    return _cached_engine(str(Path(db_path).resolve()))
+
+
+# Table names per database URL, with the time they were read
+_TABLE_CACHE_TTL = 5.0
+_table_cache: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+
+# Reflected table objects per (database URL, table name)
+_reflected_tables: Dict[Tuple[str, str], Table] = {}
+
+
+def close_database(db_path: Union[str, Path]) -> None:
+    """
+    Close the pooled connections to a database.
+    
+    The engine stays cached; the next CRUD call on the same path opens a
+    fresh connection.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    """
+    _get_engine(db_path).dispose()
+
+
+def _table_names(engine: Engine, refresh: bool = False) -> FrozenSet[str]:
+    """
+    Return the table names of a database, cached for a few seconds.
+    
+    Parameters
+    ----------
+    engine : Engine
+        SQLAlchemy engine instance.
+    refresh : bool, default False
+        If True, re-read the names from the database.
+    
+    Returns
+    -------
+    frozenset of str
+        Names of the tables in the database.
+    """
+    key = str(engine.url)
+    now = time.monotonic()
+    cached = _table_cache.get(key)
+    
+    if refresh or cached is None or now - cached[0] > _TABLE_CACHE_TTL:
+        names = frozenset(inspect(engine).get_table_names())
+        _table_cache[key] = (now, names)
+        return names
+    
+    return cached[1]
+
+
+def _invalidate_table_cache(engine: Engine) -> None:
+    """
+    Drop the cached table names of a database.
+    
+    Call after any operation that creates or drops tables.
+    
+    Parameters
+    ----------
+    engine : Engine
+        SQLAlchemy engine instance.
+    """
+    url = str(engine.url)
+    _table_cache.pop(url, None)
+    for key in [k for k in _reflected_tables if k[0] == url]:
+        del _reflected_tables[key]
+
+
+def invalidate_table_cache(db_path: Union[str, Path]) -> None:
+    """
+    Forget the cached table names and reflected tables of a database.
+    
+    Writers outside this module (e.g. ``load_to_database``) call this
+    after creating, replacing or dropping tables.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    """
+    _invalidate_table_cache(_get_engine(db_path))
+
+
+def _get_table(engine: Engine, table_name: str, columns=()) -> Table:
+    """
+    Return the reflected Table for a database table (cached).
+    
+    Parameters
+    ----------
+    engine : Engine
+        SQLAlchemy engine instance.
+    table_name : str
+        Name of the table.
+    columns : iterable of str, optional
+        Columns the caller needs. If the cached reflection lacks any of
+        them, the table is reflected again.
+    
+    Returns
+    -------
+    Table
+        SQLAlchemy Table bound to the database schema.
+    """
+    key = (str(engine.url), table_name)
+    table = _reflected_tables.get(key)
+    
+    if table is None or not set(columns) <= set(table.c.keys()):
+        table = Table(table_name, MetaData(), autoload_with=engine)
+        _reflected_tables[key] = table
+    
+    return table
 
 
 def _validate_table_exists(engine: Engine, table_name: str) -> None:
     """
     Validate that a table exists in the database.
     
+    The cached table names are consulted first; on a miss they are
+    re-read once, so tables created by other connections are found.
+    
     Parameters
     ----------
     engine : Engine
@@ -45,8 +203,9 @@ def _validate_table_exists(engine: Engine, table_name: str) -> None:
     ValueError
         If the table does not exist.
     """
-    inspector = inspect(engine)
-    if table_name not in inspector.get_table_names():
+    if table_name in _table_names(engine):
+        return
+    if table_name not in _table_names(engine, refresh=True):
         raise ValueError(f"Table '{table_name}' does not exist in database")
 
 
@@ -82,18 +241,17 @@ def create_record(db_path: Union[str, Path], table_name: str, record: Dict[str,
     engine = _get_engine(db_path)
     _validate_table_exists(engine, table_name)
     
-    # Get existing columns to validate
-    inspector = inspect(engine)
-    existing_columns = [col['name'] for col in inspector.get_columns(table_name)]
+    # Existing columns come from the cached reflection, not a PRAGMA per call
+    existing_columns = _get_table(engine, table_name, record).c.keys()
     
     # Check if record has all required columns (excluding auto-increment)
-    missing_cols = set(existing_columns) - set(record.keys())
-    if missing_cols:
+    if not record.keys() >= set(existing_columns):
+        missing_cols = set(existing_columns) - set(record.keys())
         raise ValueError(f"Missing required columns: {missing_cols}")
     
-    # Convert record to DataFrame and append
-    df = pd.DataFrame([record])
-    df.to_sql(table_name, engine, if_exists='append', index=False)
+    # Plain INSERT of the values; no DataFrame or to_sql round trip
+    with engine.begin() as conn:
+        _insert_rows(conn, engine, table_name, [record])
     
     return True
 
@@ -133,19 +291,162 @@ def create_records(db_path: Union[str, Path], table_name: str, records: List[Dic
     engine = _get_engine(db_path)
     _validate_table_exists(engine, table_name)
     
-    # Convert records to DataFrame and append
-    df = pd.DataFrame(records)
-    df.to_sql(table_name, engine, if_exists='append', index=False)
+    if not records:
+        return True
+    
+    # One prepared INSERT executed for all rows in a single transaction
+    with engine.begin() as conn:
+        _insert_rows(conn, engine, table_name, records)
     
     return True
 
 
+def create_records_bulk(db_path: Union[str, Path], table_name: str,
+                        records: Iterable[Dict[str, Any]], chunk_size: int = 10000) -> int:
+    """
+    Bulk-load records straight through the sqlite3 driver.
+    
+    Intended for seeding or loading large batches: the records are written
+    in one ``BEGIN IMMEDIATE`` transaction with ``executemany`` on the raw
+    DBAPI connection, bypassing SQLAlchemy's expression layer. Records are
+    consumed in chunks, so a generator keeps memory bounded.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    table_name : str
+        Name of the table to insert into.
+    records : iterable of dict
+        Records keyed by column name. Columns a record lacks are stored
+        as NULL; keys that aren't table columns are ignored.
+    chunk_size : int, default 10000
+        Number of records passed to each executemany call.
+    
+    Returns
+    -------
+    int
+        Number of records inserted.
+    
+    Raises
+    ------
+    ValueError
+        If the table doesn't exist.
+    
+    Examples
+    --------
+    >>> create_records_bulk("data/health.db", "patients", patients)
+    100000
+    """
+    engine = _get_engine(db_path)
+    _validate_table_exists(engine, table_name)
+    
+    columns = tuple(_get_table(engine, table_name).c.keys())
+    statement = _insert_sql(table_name, columns)
+    
+    records = iter(records)
+    count = 0
+    raw_conn = engine.raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            while True:
+                chunk = [tuple(record.get(col) for col in columns)
+                         for record in islice(records, chunk_size)]
+                if not chunk:
+                    break
+                cursor.executemany(statement, chunk)
+                count += len(chunk)
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            cursor.close()
+    finally:
+        raw_conn.close()
+    
+    return count
+
+
+def _insert_rows(conn, engine: Engine, table_name: str,
+                 records: List[Dict[str, Any]]) -> None:
+    """
+    Insert records with a single executemany on an open connection.
+    
+    Parameters
+    ----------
+    conn : Connection
+        Open connection; the caller owns the transaction.
+    engine : Engine
+        Engine the connection belongs to (used for table reflection).
+    table_name : str
+        Name of the table to insert into.
+    records : list of dict
+        Rows to insert. Keys missing from some records are stored as NULL.
+    """
+    # Every row must bind the same parameters; absent keys become NULL
+    columns = list(dict.fromkeys(col for record in records for col in record))
+    
+    table = _get_table(engine, table_name, columns)
+    unknown = [col for col in columns if col not in table.c]
+    if unknown:
+        raise ValueError(f"Columns {unknown} do not exist in table '{table_name}'")
+    
+    rows = [tuple(record.get(col) for col in columns) for record in records]
+    _fast_insert(conn, table_name, columns, rows)
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a table or column name for use in SQLite statements."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _fast_insert(conn, table_name: str, columns: List[str], rows: List[tuple]) -> None:
+    """
+    Insert positional rows with one driver-level executemany.
+    
+    The INSERT is built once with ``?`` placeholders and handed straight to
+    the sqlite3 cursor, skipping SQLAlchemy's per-row parameter processing.
+    
+    Parameters
+    ----------
+    conn : Connection
+        Open connection; the caller owns the transaction.
+    table_name : str
+        Name of the table to insert into.
+    columns : list of str
+        Column names, in the order of the values in each row.
+    rows : list of tuple
+        Row values.
+    """
+    conn.exec_driver_sql(_insert_sql(table_name, tuple(columns)), rows)
+
+
+@lru_cache(maxsize=128)
+def _insert_sql(table_name: str, columns: Tuple[str, ...]) -> str:
+    """
+    Build the positional INSERT statement for a table and column list (cached).
+    
+    Reusing the identical string also lets sqlite3 reuse its prepared
+    statement from the connection's statement cache.
+    """
+    column_list = ", ".join(_quote_identifier(col) for col in columns)
+    placeholders = ", ".join("?" * len(columns))
+    return f"INSERT INTO {_quote_identifier(table_name)} ({column_list}) VALUES ({placeholders})"
+
+
 def read_records(db_path: Union[str, Path], 
                  table_name: str,
                  where: Optional[str] = None,
                  columns: Optional[List[str]] = None,
                  limit: Optional[int] = None,
-                 order_by: Optional[str] = None) -> pd.DataFrame:
+                 order_by: Optional[str] = None,
+                 backend: str = 'sqlalchemy',
+                 output: str = 'pandas',
+                 params: Optional[Dict[str, Any]] = None,
+                 dtype_backend: Optional[str] = None) -> pd.DataFrame:
     """
     Read records from the database table.
     
@@ -163,22 +464,51 @@ def read_records(db_path: Union[str, Path],
         Maximum number of records to return.
     order_by : str, optional
         ORDER BY clause (without 'ORDER BY' keyword), e.g., "age DESC".
+    backend : str, default 'sqlalchemy'
+        Reader to use: 'sqlalchemy' (pandas read_sql_query), or the
+        Arrow-native 'connectorx' / 'adbc' readers, which skip building
+        Python row tuples on large results. Falls back to 'sqlalchemy'
+        when the optional package is not installed.
+    output : str, default 'pandas'
+        Result type: 'pandas', 'polars' (polars.DataFrame) or 'arrow'
+        (pyarrow.Table). Callers that only export or hand the data to
+        Arrow-aware code can skip the pandas conversion.
+    params : dict, optional
+        Values for bound parameters used in the WHERE clause as ``:name``.
+        Queries with parameters are always run through SQLAlchemy.
+    dtype_backend : str, optional
+        Dtypes for the pandas result of the SQLAlchemy reader:
+        'numpy_nullable', or 'pyarrow' for Arrow-backed columns, which
+        store text far more compactly than object columns. 'pyarrow'
+        falls back to the default dtypes when pyarrow is not installed.
     
     Returns
     -------
     pd.DataFrame
-        DataFrame containing the retrieved records.
+        DataFrame containing the retrieved records (a polars DataFrame
+        or pyarrow Table when requested through ``output``).
     
     Raises
     ------
     ValueError
-        If the table doesn't exist.
+        If the table doesn't exist, or the backend or output is unknown.
+    ImportError
+        If ``output`` names a library that is not installed.
     
     Examples
     --------
     >>> read_records("data/health.db", "patients")  # Read all
     >>> read_records("data/health.db", "patients", where="age > 25", limit=10)
+    >>> read_records("data/health.db", "patients", where="country = :c",
+    ...              params={"c": "UK"}, columns=["id", "age"])
     """
+    if backend not in ('sqlalchemy', 'connectorx', 'adbc'):
+        raise ValueError(f"Unknown backend: {backend}")
+    if output not in ('pandas', 'polars', 'arrow'):
+        raise ValueError(f"Unknown output: {output}")
+    if dtype_backend not in (None, 'numpy_nullable', 'pyarrow'):
+        raise ValueError(f"Unknown dtype_backend: {dtype_backend}")
+    
     engine = _get_engine(db_path)
     _validate_table_exists(engine, table_name)
     
@@ -195,11 +525,110 @@ def read_records(db_path: Union[str, Path],
     if limit:
         query += f" LIMIT {limit}"
     
-    # Execute query
-    df = pd.read_sql_query(query, engine)
+    # Execute query; bound parameters need SQLAlchemy's text() binding
+    if params:
+        df = _read_sql(text(query), engine, params, dtype_backend)
+        if output == 'polars':
+            import polars as pl
+            return pl.from_pandas(df)
+        if output == 'arrow':
+            import pyarrow as pa
+            return pa.Table.from_pandas(df, preserve_index=False)
+        return df
+    
+    if output == 'polars':
+        import polars as pl
+        return pl.read_database(query, connection=engine)
+    
+    if output == 'arrow':
+        import pyarrow as pa
+        table = _adbc_arrow_table(db_path, query)
+        if table is None:
+            table = pa.Table.from_pandas(pd.read_sql_query(query, engine),
+                                         preserve_index=False)
+        return table
+    
+    df = _read_arrow(db_path, query, backend)
+    if df is None:
+        df = _read_sql(query, engine, None, dtype_backend)
     return df
 
 
+def _read_sql(query, engine: Engine, params: Optional[Dict[str, Any]],
+              dtype_backend: Optional[str]) -> pd.DataFrame:
+    """Run a query with pandas, using ``dtype_backend`` where it is available."""
+    if dtype_backend == 'pyarrow':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            dtype_backend = None
+    
+    if dtype_backend is None:
+        return pd.read_sql_query(query, engine, params=params)
+    return pd.read_sql_query(query, engine, params=params, dtype_backend=dtype_backend)
+
+
+def _read_arrow(db_path: Union[str, Path], query: str, backend: str) -> Optional[pd.DataFrame]:
+    """
+    Run a query through an Arrow-native SQLite reader, if available.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    query : str
+        SQL query to execute.
+    backend : str
+        'connectorx' or 'adbc'; any other value returns None.
+    
+    Returns
+    -------
+    pd.DataFrame or None
+        Query results, or None if the backend is not installed.
+    """
+    path = Path(db_path).resolve()
+    
+    if backend == 'connectorx':
+        try:
+            import connectorx as cx
+        except ImportError:
+            return None
+        return cx.read_sql(f"sqlite://{path.as_posix()}", query, return_type="pandas")
+    
+    if backend == 'adbc':
+        table = _adbc_arrow_table(path, query)
+        return table.to_pandas() if table is not None else None
+    
+    return None
+
+
+def _adbc_arrow_table(db_path: Union[str, Path], query: str):
+    """
+    Run a query with the ADBC SQLite driver and return an Arrow table.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    query : str
+        SQL query to execute.
+    
+    Returns
+    -------
+    pyarrow.Table or None
+        Query results, or None if adbc_driver_sqlite is not installed.
+    """
+    try:
+        import adbc_driver_sqlite.dbapi as adbc
+    except ImportError:
+        return None
+    
+    with adbc.connect(str(Path(db_path).resolve())) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(query)
+            return cursor.fetch_arrow_table()
+
+
 def read_record_by_id(db_path: Union[str, Path], 
                       table_name: str,
                       id_column: str,
@@ -228,18 +657,25 @@ def read_record_by_id(db_path: Union[str, Path],
     >>> read_record_by_id("data/health.db", "patients", "id", 1)
     {'id': 1, 'name': 'John', 'age': 30}
     """
-    df = read_records(db_path, table_name, where=f"{id_column}={id_value}", limit=1)
+    engine = _get_engine(db_path)
+    _validate_table_exists(engine, table_name)
     
-    if df.empty:
-        return None
+    # Bound parameter: the statement text is the same for every id value,
+    # so the compiled statement is reused across lookups
+    query = text(f"SELECT * FROM {table_name} WHERE {id_column}=:id_value LIMIT 1")
+    
+    # Single row: fetch it as a mapping rather than building a DataFrame
+    with engine.connect() as conn:
+        row = conn.execute(query, {'id_value': id_value}).mappings().first()
     
-    return df.iloc[0].to_dict()
+    return dict(row) if row is not None else None
 
 
 def update_record(db_path: Union[str, Path],
                   table_name: str,
                   updates: Dict[str, Any],
-                  where: Optional[str] = None) -> int:
+                  where: Optional[str] = None,
+                  params: Optional[Dict[str, Any]] = None) -> int:
     """
     Update records in the database table.
     
@@ -254,6 +690,9 @@ def update_record(db_path: Union[str, Path],
     where : str
         WHERE clause (without 'WHERE' keyword), e.g., "id=1".
         REQUIRED for safety - prevents accidental update of all records.
+    params : dict, optional
+        Values for bound parameters used in the WHERE clause as ``:name``.
+        Names starting with ``_set`` are reserved for the new values.
     
     Returns
     -------
@@ -277,13 +716,16 @@ def update_record(db_path: Union[str, Path],
     engine = _get_engine(db_path)
     _validate_table_exists(engine, table_name)
     
-    # Build UPDATE statement
-    set_clause = ', '.join([f"{col}=:{col}" for col in updates.keys()])
-    query = f"UPDATE {table_name} SET {set_clause} WHERE {where}"
+    # One UPDATE for all columns; values are bound under generated names so
+    # any column name (spaces, quotes, WHERE parameter names) is safe
+    set_clause = ', '.join(f"{_quote_identifier(col)}=:_set{i}"
+                           for i, col in enumerate(updates))
+    values = {f"_set{i}": value for i, value in enumerate(updates.values())}
+    query = f"UPDATE {_quote_identifier(table_name)} SET {set_clause} WHERE {where}"
     
     # Execute update
     with engine.connect() as conn:
-        result = conn.execute(text(query), updates)
+        result = conn.execute(text(query), {**values, **(params or {})})
         conn.commit()
         return result.rowcount
 
@@ -320,13 +762,62 @@ def update_records(db_path: Union[str, Path],
     ...                {"age": 31, "name": "John Smith"})
     1
     """
-    where = f"{id_column}={id_value}"
-    return update_record(db_path, table_name, updates, where=where)
+    where = f"{id_column}=:__id"
+    return update_record(db_path, table_name, updates, where=where,
+                         params={'__id': id_value})
+
+
+def count_records(db_path: Union[str, Path],
+                  table_name: str,
+                  where: Optional[str] = None,
+                  params: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Count the records in a table, optionally matching a WHERE clause.
+    
+    The count is computed by SQLite (``SELECT COUNT(*)``), so no rows are
+    transferred.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    table_name : str
+        Name of the table to count.
+    where : str, optional
+        WHERE clause (without 'WHERE' keyword), e.g., "age > 25".
+    params : dict, optional
+        Values for bound parameters used in the WHERE clause as ``:name``.
+    
+    Returns
+    -------
+    int
+        Number of matching records.
+    
+    Raises
+    ------
+    ValueError
+        If the table doesn't exist.
+    
+    Examples
+    --------
+    >>> count_records("data/health.db", "patients", where="age > 25")
+    42
+    """
+    engine = _get_engine(db_path)
+    _validate_table_exists(engine, table_name)
+    
+    query = f"SELECT COUNT(*) FROM {table_name}"
+    if where:
+        query += f" WHERE {where}"
+    
+    with engine.connect() as conn:
+        return conn.execute(text(query), params or {}).scalar()
 
 
 def delete_record(db_path: Union[str, Path],
                   table_name: str,
-                  where: Optional[str] = None) -> int:
+                  where: Optional[str] = None,
+                  params: Optional[Dict[str, Any]] = None) -> int:
     """
     Delete records from the database table.
     
@@ -339,6 +830,8 @@ def delete_record(db_path: Union[str, Path],
     where : str
         WHERE clause (without 'WHERE' keyword), e.g., "id=1".
         REQUIRED for safety - prevents accidental deletion of all records.
+    params : dict, optional
+        Values for bound parameters used in the WHERE clause as ``:name``.
     
     Returns
     -------
@@ -366,7 +859,7 @@ def delete_record(db_path: Union[str, Path],
     
     # Execute delete
     with engine.connect() as conn:
-        result = conn.execute(text(query))
+        result = conn.execute(text(query), params or {})
         conn.commit()
         return result.rowcount
 
@@ -399,14 +892,77 @@ def delete_records(db_path: Union[str, Path],
     >>> delete_records("data/health.db", "patients", "id", 1)
     1
     """
-    where = f"{id_column}={id_value}"
-    return delete_record(db_path, table_name, where=where)
+    where = f"{id_column}=:__id"
+    return delete_record(db_path, table_name, where=where, params={'__id': id_value})
+
+
+# Authorizer actions a read-only query may perform
+_READ_ONLY_ACTIONS = frozenset({
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    getattr(sqlite3, 'SQLITE_RECURSIVE', 33),
+})
+
+
+def _authorize_read_only(action: int, *args) -> int:
+    """SQLite authorizer callback that denies everything but reads."""
+    return sqlite3.SQLITE_OK if action in _READ_ONLY_ACTIONS else sqlite3.SQLITE_DENY
+
+
+def validate_select_query(db_path: Union[str, Path], query: str) -> None:
+    """
+    Check that a query is a single statement that only reads data.
+    
+    The query is compiled by SQLite itself (``EXPLAIN``, so nothing is
+    executed) on a read-only connection whose authorizer denies every
+    action except reading tables and calling functions. This rejects
+    writes hidden after a ``;`` or inside a CTE, which a prefix check on
+    the text would let through.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    query : str
+        SQL query to check.
+    
+    Raises
+    ------
+    FileNotFoundError
+        If the database file does not exist.
+    ValueError
+        If the query is not a single read-only statement, or is invalid.
+    
+    Examples
+    --------
+    >>> validate_select_query("data/health.db", "SELECT * FROM patients")
+    >>> validate_select_query("data/health.db", "SELECT 1; DROP TABLE patients")
+    Traceback (most recent call last):
+    ...
+    ValueError: Only single SELECT queries are allowed: ...
+    """
+    path = Path(db_path).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"Database not found: {db_path}")
+    
+    conn = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True)
+    try:
+        conn.set_authorizer(_authorize_read_only)
+        conn.execute(f"EXPLAIN {query}")
+    except (sqlite3.DatabaseError, sqlite3.ProgrammingError, sqlite3.Warning) as e:
+        raise ValueError(f"Only single SELECT queries are allowed: {e}")
+    finally:
+        conn.close()
 
 
 def list_tables(db_path: Union[str, Path]) -> List[str]:
     """
     List all tables in the database.
     
+    The names are always re-read, and the cache used by the other CRUD
+    functions is refreshed with them.
+    
     Parameters
     ----------
     db_path : str or Path
@@ -422,9 +978,7 @@ def list_tables(db_path: Union[str, Path]) -> List[str]:
     >>> list_tables("data/health.db")
     ['patients', 'vaccinations', 'outbreaks']
     """
-    engine = _get_engine(db_path)
-    inspector = inspect(engine)
-    return inspector.get_table_names()
+    return sorted(_table_names(_get_engine(db_path), refresh=True))
 
 
 def table_exists(db_path: Union[str, Path], table_name: str) -> bool:
@@ -448,11 +1002,11 @@ def table_exists(db_path: Union[str, Path], table_name: str) -> bool:
     >>> table_exists("data/health.db", "patients")
     True
     """
-    tables = list_tables(db_path)
-    return table_name in tables
+    return table_name in _table_names(_get_engine(db_path), refresh=True)
 
 
-def get_table_info(db_path: Union[str, Path], table_name: str) -> Dict[str, Any]:
+def get_table_info(db_path: Union[str, Path], table_name: str,
+                   exact: bool = True) -> Dict[str, Any]:
     """
     Get information about a table (columns, types, row count).
     
@@ -462,13 +1016,17 @@ def get_table_info(db_path: Union[str, Path], table_name: str) -> Dict[str, Any]
         Path to the SQLite database.
     table_name : str
         Name of the table.
+    exact : bool, default True
+        If False, estimate the row count from ``MAX(rowid)`` (an index
+        lookup) instead of scanning the table with ``COUNT(*)``. The
+        estimate is exact until rows are deleted.
     
     Returns
     -------
     dict
         Dictionary containing table information:
         - 'columns': list of column dictionaries with 'name' and 'type'
-        - 'row_count': number of rows in the table
+        - 'row_count': number of rows in the table (estimated if exact=False)
     
     Raises
     ------
@@ -490,20 +1048,245 @@ def get_table_info(db_path: Union[str, Path], table_name: str) -> Dict[str, Any]
     engine = _get_engine(db_path)
     _validate_table_exists(engine, table_name)
     
-    inspector = inspect(engine)
-    columns = inspector.get_columns(table_name)
+    quoted = _quote_identifier(table_name)
     
-    # Get row count
+    # Columns and row count from one connection checkout
     with engine.connect() as conn:
-        result = conn.execute(text(f"SELECT COUNT(*) FROM {table_name}"))
-        row_count = result.scalar()
-    
+        columns = conn.exec_driver_sql(f"PRAGMA table_info({quoted})").all()
+        row_count = None
+        if not exact:
+            try:
+                row_count = conn.exec_driver_sql(f"SELECT MAX(rowid) FROM {quoted}").scalar() or 0
+            except OperationalError:
+                pass  # WITHOUT ROWID table: count instead
+        if row_count is None:
+            row_count = conn.exec_driver_sql(f"SELECT COUNT(*) FROM {quoted}").scalar()
+    
+    # PRAGMA table_info rows: (cid, name, type, notnull, default, pk)
     return {
-        'columns': [{'name': col['name'], 'type': str(col['type'])} for col in columns],
+        'columns': [{'name': col[1], 'type': col[2] or 'NULL'} for col in columns],
         'row_count': row_count
     }
 
 
+def indexed_columns(db_path: Union[str, Path], table_name: str) -> FrozenSet[str]:
+    """
+    Return the columns that lead an index on a table.
+    
+    A filter on one of these columns can already be answered from an index.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    table_name : str
+        Name of the table.
+    
+    Returns
+    -------
+    frozenset of str
+        First column of each index on the table.
+    
+    Raises
+    ------
+    ValueError
+        If the table doesn't exist.
+    """
+    engine = _get_engine(db_path)
+    _validate_table_exists(engine, table_name)
+    
+    with engine.connect() as conn:
+        # PRAGMA index_list rows: (seq, name, unique, origin, partial)
+        indexes = conn.exec_driver_sql(
+            f"PRAGMA index_list({_quote_identifier(table_name)})").all()
+        leading = set()
+        for index in indexes:
+            # PRAGMA index_info rows: (seqno, cid, name)
+            info = conn.exec_driver_sql(
+                f"PRAGMA index_info({_quote_identifier(index[1])})").all()
+            if info and info[0][2] is not None:
+                leading.add(info[0][2])
+    
+    return frozenset(leading)
+
+
+def create_index(db_path: Union[str, Path], table_name: str, column: str) -> str:
+    """
+    Create an index on one column of a table, if it doesn't exist yet.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    table_name : str
+        Name of the table.
+    column : str
+        Column to index.
+    
+    Returns
+    -------
+    str
+        Name of the index, ``ix_<table>_<column>``.
+    
+    Raises
+    ------
+    ValueError
+        If the table doesn't exist.
+    
+    Examples
+    --------
+    >>> create_index("data/health.db", "vaccinations", "country")
+    'ix_vaccinations_country'
+    """
+    engine = _get_engine(db_path)
+    _validate_table_exists(engine, table_name)
+    
+    index_name = f"ix_{table_name}_{column}"
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"CREATE INDEX IF NOT EXISTS {_quote_identifier(index_name)} "
+            f"ON {_quote_identifier(table_name)} ({_quote_identifier(column)})")
+    
+    return index_name
+
+
+def _lenient(cast: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Wrap a cast so values it cannot convert are returned unchanged."""
+    def convert(value: str) -> Any:
+        try:
+            return cast(value)
+        except ValueError:
+            return value
+    return convert
+
+
+_TO_INT = _lenient(int)
+_TO_FLOAT = _lenient(float)
+
+
+def _identity(value: str) -> str:
+    return value
+
+
+@lru_cache(maxsize=None)
+def _converter_for(declared_type: str) -> Callable[[str], Any]:
+    """Pick the text-to-value converter for a declared column type (cached)."""
+    declared = declared_type.upper()
+    if 'INT' in declared:
+        return _TO_INT
+    if 'REAL' in declared or 'FLOAT' in declared:
+        return _TO_FLOAT
+    return _identity
+
+
+def column_converters(columns: List[Dict[str, str]]) -> Dict[str, Callable[[str], Any]]:
+    """
+    Build a converter per column for turning entered text into values.
+    
+    The declared type of each column is inspected once here, so converting
+    a row is a plain dictionary lookup and call per field. INTEGER-like
+    columns convert with int, REAL/FLOAT columns with float, and all other
+    columns keep the text. Text that does not parse is kept as-is.
+    
+    Parameters
+    ----------
+    columns : list of dict
+        Column descriptions with 'name' and 'type' keys, as returned in
+        ``get_table_info(...)['columns']``.
+    
+    Returns
+    -------
+    dict
+        Mapping of column name to converter.
+    
+    Examples
+    --------
+    >>> info = get_table_info("data/health.db", "patients")
+    >>> converters = column_converters(info['columns'])
+    >>> converters['age']("42")
+    42
+    """
+    return {col['name']: _converter_for(col['type']) for col in columns}
+
+
+class BatchInserter:
+    """
+    Context manager that buffers single-record inserts and writes them
+    in batches inside one transaction.
+    
+    Use it instead of calling create_record() in a loop, which opens and
+    commits a transaction for every row.
+    
+    The batch runs on a pooled connection of its own. Other CRUD calls
+    don't see its rows until it commits, and since SQLite allows one
+    writer at a time, writes to the same database from elsewhere wait
+    for the commit.
+    
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the SQLite database.
+    table_name : str
+        Name of the table to insert into.
+    flush_every : int, default 1000
+        Number of buffered records that triggers a batch insert.
+    
+    Raises
+    ------
+    ValueError
+        If the table doesn't exist.
+    
+    Examples
+    --------
+    >>> with BatchInserter("data/health.db", "patients") as batch:
+    ...     for patient in patients:
+    ...         batch.add(patient)
+    """
+    
+    def __init__(self, db_path: Union[str, Path], table_name: str, flush_every: int = 1000):
+        """Initialize the inserter and check that the table exists."""
+        self.engine = _get_engine(db_path)
+        _validate_table_exists(self.engine, table_name)
+        self.table_name = table_name
+        self.flush_every = flush_every
+        self.count = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._conn = None
+        self._transaction = None
+    
+    def __enter__(self) -> 'BatchInserter':
+        """Open the connection and begin the transaction."""
+        self._conn = self.engine.connect()
+        self._transaction = self._conn.begin()
+        return self
+    
+    def add(self, record: Dict[str, Any]) -> None:
+        """Buffer a record, inserting the batch once it is full."""
+        self._buffer.append(record)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Insert all buffered records."""
+        if not self._buffer:
+            return
+        _insert_rows(self._conn, self.engine, self.table_name, self._buffer)
+        self.count += len(self._buffer)
+        self._buffer = []
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Flush and commit, or roll back everything if an error occurred."""
+        try:
+            if exc_type is None:
+                self.flush()
+                self._transaction.commit()
+            else:
+                self._transaction.rollback()
+        finally:
+            self._conn.close()
+        return False
+
+
 class CRUDManager:
     """
     A class-based interface for CRUD operations on a database.
@@ -537,6 +1320,14 @@ class CRUDManager:
         """Create multiple records. See create_records() for details."""
         return create_records(self.db_path, table_name, records)
     
+    def create_bulk(self, table_name: str, records: Iterable[Dict[str, Any]]) -> int:
+        """Bulk-load records. See create_records_bulk for details."""
+        return create_records_bulk(self.db_path, table_name, records)
+    
+    def batch_insert(self, table_name: str, flush_every: int = 1000) -> BatchInserter:
+        """Buffer many inserts in one transaction. See BatchInserter for details."""
+        return BatchInserter(self.db_path, table_name, flush_every=flush_every)
+    
     def read(self, table_name: str, **kwargs) -> pd.DataFrame:
         """Read records. See read_records() for details."""
         return read_records(self.db_path, table_name, **kwargs)
@@ -5,25 +5,35 @@ Main entry point for the command-line interface.
 Provides menu-driven access to all functionality.
 """
 
+import atexit
+import heapq
+import logging
+import re
+import sys
 from pathlib import Path
+from typing import Dict, Set, Tuple
 import pandas as pd
 
 from src.cli import (
     clear_screen, print_header, print_menu, get_user_choice, get_user_input,
-    display_dataframe, display_summary_stats, display_grouped_data,
+    print_numbered, display_dataframe, display_summary_stats, display_grouped_data,
     plot_bar_chart, plot_line_chart, plot_grouped_bar_chart,
     confirm_action, pause, CLISession, export_to_csv
 )
-from src.main import load_dataset, load_json_dataset, load_to_database, read_from_database
-from src.cleaning import DataCleaner, detect_missing_values
+from src.main import (
+    load_dataset, load_json_dataset, load_to_database, read_from_database, dispose_engines
+)
+from src.fast_export import bulk_export_enabled, stream_to_database
+from src.cache import load_or_feather
 from src.analysis import (
-    filter_by_column, filter_by_numeric_range, filter_by_date_range,
-    calculate_summary_stats, get_column_statistics, group_and_aggregate,
-    calculate_trends, DataAnalyzer
+    filter_by_date_range,
+    get_column_statistics, group_and_aggregate,
+    calculate_trends, calculate_period_trends, DataAnalyzer
 )
 from src.crud import (
-    CRUDManager, list_tables, get_table_info, create_record,
-    read_records, update_record, delete_record
+    CRUDManager, list_tables, get_table_info, column_converters, create_record,
+    read_records, count_records, update_record, delete_record, close_database,
+    create_index, indexed_columns, validate_select_query
 )
 from src.activity_logger import (
     ActivityLogger, log_data_operation, log_crud_operation, log_error,
@@ -39,10 +49,26 @@ class HealthDashboard:
         self.session = CLISession()
         self.running = True
         
+        # Tables loaded from databases, keyed by (resolved db path, table);
+        # each entry keeps the file signature it was read at
+        self._db_cache: Dict[Tuple[str, str], Tuple[Tuple[int, ...], pd.DataFrame]] = {}
+        
+        # Databases opened from the CRUD menu; their pooled connections stay
+        # open across visits to the menu and are closed on exit
+        self._open_databases: Set[str] = set()
+        
+        # (db path, table, column) filters already offered an index, so the
+        # user is asked at most once per column in a session
+        self._index_offered: Set[Tuple[str, str, str]] = set()
+        
         # Initialize activity logger
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
-        self.logger = ActivityLogger(log_dir / "dashboard_activity.log", user="dashboard_user")
+        # Records are written by a background thread so menu actions don't
+        # wait on the file; whatever is still queued is written at exit
+        self.logger = ActivityLogger(log_dir / "dashboard_activity.log", user="dashboard_user",
+                                     background=True)
+        atexit.register(self.logger.close)
     
     def run(self):
         """Run the main dashboard loop."""
@@ -70,26 +96,20 @@ class HealthDashboard:
         print_menu("Main Menu", options)
         choice = get_user_choice(len(options))
         
-        if choice == 1:
-            self.load_data_menu()
-        elif choice == 2:
-            self.view_data_menu()
-        elif choice == 3:
-            self.filter_data_menu()
-        elif choice == 4:
-            self.analyze_data_menu()
-        elif choice == 5:
-            self.visualize_data_menu()
-        elif choice == 6:
-            self.clean_data_menu()
-        elif choice == 7:
-            self.export_data_menu()
-        elif choice == 8:
-            self.database_management_menu()
-        elif choice == 9:
-            self.view_activity_log_menu()
-        elif choice == 0:
-            self.exit_dashboard()
+        handler = {
+            1: self.load_data_menu,
+            2: self.view_data_menu,
+            3: self.filter_data_menu,
+            4: self.analyze_data_menu,
+            5: self.visualize_data_menu,
+            6: self.clean_data_menu,
+            7: self.export_data_menu,
+            8: self.database_management_menu,
+            9: self.view_activity_log_menu,
+            0: self.exit_dashboard
+        }.get(choice)
+        if handler:
+            handler()
     
     def load_data_menu(self):
         """Handle data loading menu."""
@@ -98,32 +118,72 @@ class HealthDashboard:
             "Load Sample Vaccination Data (CSV)",
             "Load Sample Outbreak Data (JSON)",
             "Load Custom CSV File",
-            "Load from Database"
+            "Load from Database",
+            f"Toggle Fast CSV Parser (currently {'on' if self.session.fast_io else 'off'})"
         ]
         
         print_menu("Load Data", options)
         choice = get_user_choice(len(options))
         
-        if choice == 1:
-            self.load_sample_vaccination_data()
-        elif choice == 2:
-            self.load_sample_outbreak_data()
-        elif choice == 3:
-            self.load_custom_csv()
-        elif choice == 4:
-            self.load_from_database()
+        handler = {
+            1: self.load_sample_vaccination_data,
+            2: self.load_sample_outbreak_data,
+            3: self.load_custom_csv,
+            4: self.load_from_database,
+            5: self.toggle_fast_io
+        }.get(choice)
+        if handler:
+            handler()
+    
+    def toggle_fast_io(self):
+        """Switch the session between the fast and the default CSV parser."""
+        self.session.fast_io = not self.session.fast_io
+        # The loaded data came from the other parser; reload it on request
+        self.session.source = None
+        state = "enabled" if self.session.fast_io else "disabled"
+        print(f"\n[INFO] Fast CSV parser {state}")
+        pause()
+    
+    def _read_csv(self, path):
+        """Read a CSV file, using the fast reader when the session enables it."""
+        return load_dataset(path, fast=self.session.fast_io)
+    
+    def _csv_variant(self) -> str:
+        """Cache variant of the CSV parser the session currently uses."""
+        return "fast" if self.session.fast_io else "default"
+    
+    def _reuse_loaded(self, path: str) -> bool:
+        """
+        Restore the session's loaded data instead of re-reading an unchanged file.
+        
+        Reloading the file that is already loaded (same path, modification
+        time and size) just resets filters and cleaning, as a fresh load would.
+        """
+        if not self.session.is_loaded_from(path):
+            return False
+        
+        self.session.reset_filters()
+        print(f"\n[INFO] {Path(path).name} is unchanged since it was loaded; restored the loaded data")
+        pause()
+        return True
     
     def load_sample_vaccination_data(self):
         """Load sample vaccination data."""
+        if self._reuse_loaded("data/sample_vaccination_data.csv"):
+            return
+        
         try:
-            df = load_dataset("data/sample_vaccination_data.csv")
-            self.session.load_data(df, "Sample Vaccination Data")
+            df = load_or_feather("data/sample_vaccination_data.csv", self._read_csv,
+                                 variant=self._csv_variant())
+            self.session.load_data(df, "Sample Vaccination Data",
+                                   source=self.session.source_signature("data/sample_vaccination_data.csv"))
+            n_rows, n_cols = df.shape
             log_data_operation(self.logger, "load", 
                              "Loaded sample vaccination data from CSV",
                              file_path="data/sample_vaccination_data.csv",
-                             records=len(df), columns=len(df.columns))
+                             records=n_rows, columns=n_cols)
             print("\n[SUCCESS] Loaded vaccination data")
-            print(f"Records: {len(df)}, Columns: {len(df.columns)}")
+            print(f"Records: {n_rows}, Columns: {n_cols}")
         except Exception as e:
             log_error(self.logger, "load_data", str(e), 
                      file_path="data/sample_vaccination_data.csv")
@@ -132,15 +192,20 @@ class HealthDashboard:
     
     def load_sample_outbreak_data(self):
         """Load sample outbreak data."""
+        if self._reuse_loaded("data/sample_disease_outbreak.json"):
+            return
+        
         try:
-            df = load_json_dataset("data/sample_disease_outbreak.json")
-            self.session.load_data(df, "Sample Disease Outbreak Data")
+            df = load_or_feather("data/sample_disease_outbreak.json", load_json_dataset)
+            self.session.load_data(df, "Sample Disease Outbreak Data",
+                                   source=self.session.source_signature("data/sample_disease_outbreak.json"))
+            n_rows, n_cols = df.shape
             log_data_operation(self.logger, "load",
                              "Loaded sample disease outbreak data from JSON",
                              file_path="data/sample_disease_outbreak.json",
-                             records=len(df), columns=len(df.columns))
+                             records=n_rows, columns=n_cols)
             print("\n[SUCCESS] Loaded outbreak data")
-            print(f"Records: {len(df)}, Columns: {len(df.columns)}")
+            print(f"Records: {n_rows}, Columns: {n_cols}")
         except Exception as e:
             log_error(self.logger, "load_data", str(e),
                      file_path="data/sample_disease_outbreak.json")
@@ -153,15 +218,20 @@ class HealthDashboard:
         if not filepath:
             return
         
+        if self._reuse_loaded(filepath):
+            return
+        
         try:
-            df = load_dataset(filepath)
+            df = load_or_feather(filepath, self._read_csv,
+                                 variant=self._csv_variant())
             filename = Path(filepath).name
-            self.session.load_data(df, filename)
+            self.session.load_data(df, filename, source=self.session.source_signature(filepath))
+            n_rows, n_cols = df.shape
             log_data_operation(self.logger, "load",
                              f"Loaded custom CSV file: {filename}",
-                             file_path=filepath, records=len(df), columns=len(df.columns))
+                             file_path=filepath, records=n_rows, columns=n_cols)
             print(f"\n[SUCCESS] Loaded {filename}")
-            print(f"Records: {len(df)}, Columns: {len(df.columns)}")
+            print(f"Records: {n_rows}, Columns: {n_cols}")
         except Exception as e:
             log_error(self.logger, "load_data", str(e), file_path=filepath)
             print(f"\n[ERROR] Failed to load data: {e}")
@@ -177,14 +247,45 @@ class HealthDashboard:
         if not table_name:
             return
         
+        engine = get_user_input("Reader engine (sqlalchemy/connectorx, default: sqlalchemy)",
+                                "string") or "sqlalchemy"
+        
         try:
-            df = read_from_database(db_path, table_name)
+            df = self._read_table_cached(db_path, table_name, engine)
             self.session.load_data(df, f"{table_name} (from database)")
             print(f"\n[SUCCESS] Loaded {len(df)} records from {table_name}")
         except Exception as e:
             print(f"\n[ERROR] Failed to load from database: {e}")
         pause()
     
+    @staticmethod
+    def _db_key(db_path) -> Tuple[str, Tuple[int, ...]]:
+        """Resolved database path and the modification times of its files."""
+        path = Path(db_path).resolve()
+        signature = tuple(p.stat().st_mtime_ns if p.exists() else 0
+                          for p in (path, path.with_name(path.name + "-wal")))
+        return str(path), signature
+    
+    def _read_table_cached(self, db_path, table_name: str, engine: str) -> pd.DataFrame:
+        """
+        Read a whole table, reusing the last read while the database is unchanged.
+        
+        Entries are dropped when the dashboard writes to the table, and are
+        re-read when the database or its WAL file has been modified since.
+        """
+        path, signature = self._db_key(db_path)
+        cached = self._db_cache.get((path, table_name))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        df = read_from_database(db_path, table_name, engine=engine)
+        self._db_cache[(path, table_name)] = (signature, df)
+        return df
+    
+    def _invalidate_db_cache(self, db_path, table_name: str):
+        """Forget the cached copy of a table after the dashboard modifies it."""
+        self._db_cache.pop((self._db_key(db_path)[0], table_name), None)
+    
     def view_data_menu(self):
         """Handle data viewing menu."""
         if not self.session.has_data():
@@ -229,19 +330,40 @@ class HealthDashboard:
         print(f"Total Records: {len(df)}")
         print(f"Total Columns: {len(df.columns)}")
         print(f"\nColumn Details:")
-        print(df.dtypes.to_string())
+        print(self._dtypes_text())
         print()
     
+    def _dtypes_text(self) -> str:
+        """
+        Column names and dtypes of the current data, laid out like
+        ``df.dtypes.to_string()`` but joined directly (cached per data version).
+        """
+        def build() -> str:
+            pairs = [(str(col), str(dtype))
+                     for col, dtype in self.session.get_current_data().dtypes.items()]
+            if not pairs:
+                return ""
+            name_width = max(len(col) for col, _ in pairs)
+            type_width = max(len(dtype) for _, dtype in pairs)
+            return "\n".join(f"{col:<{name_width}}    {dtype:>{type_width}}"
+                             for col, dtype in pairs)
+        
+        return self.session.cached("dtypes", build)
+    
     def view_column_names(self, df: pd.DataFrame):
         """Display column names."""
         print_header("Column Names")
-        for i, col in enumerate(df.columns, 1):
-            print(f"  {i}. {col} ({df[col].dtype})")
+        print_numbered(f"{col} ({dtype})" for col, dtype in df.dtypes.items())
         print()
     
+    def _cached_stats(self) -> Dict[str, Dict[str, float]]:
+        """Statistics of every numeric column, computed once per version of the current data."""
+        df = self.session.get_current_data()
+        return self.session.cached("column_stats", lambda: get_column_statistics(df))
+    
     def view_summary_statistics(self, df: pd.DataFrame):
         """Display summary statistics for all numeric columns."""
-        stats = get_column_statistics(df)
+        stats = self._cached_stats()
         if not stats:
             print("\n[INFO] No numeric columns found.")
             return
@@ -268,35 +390,32 @@ class HealthDashboard:
         print_menu("Filter Data", options)
         choice = get_user_choice(len(options))
         
-        if choice == 1:
-            self.filter_by_column_value()
-        elif choice == 2:
-            self.filter_by_numeric_range_menu()
-        elif choice == 3:
-            self.filter_by_date_range_menu()
-        elif choice == 4:
-            self.reset_filters()
-        elif choice == 5:
-            self.show_current_filters()
+        handler = {
+            1: self.filter_by_column_value,
+            2: self.filter_by_numeric_range_menu,
+            3: self.filter_by_date_range_menu,
+            4: self.reset_filters,
+            5: self.show_current_filters
+        }.get(choice)
+        if handler:
+            handler()
     
     def filter_by_column_value(self):
         """Filter data by column value."""
         df = self.session.get_current_data()
         
         print("\nAvailable columns:")
-        for i, col in enumerate(df.columns, 1):
-            print(f"  {i}. {col}")
+        print_numbered(df.columns)
         
         col_name = get_user_input("\nEnter column name", "string")
-        if not col_name or col_name not in df.columns:
+        if not col_name or not self.session.has_column(col_name):
             print("[ERROR] Invalid column name")
             pause()
             return
         
         print(f"\nUnique values in '{col_name}':")
-        unique_values = df[col_name].unique()
-        for i, val in enumerate(unique_values[:20], 1):
-            print(f"  {i}. {val}")
+        unique_values = self.session.unique_values(col_name)
+        print_numbered(unique_values[:20])
         if len(unique_values) > 20:
             print(f"  ... and {len(unique_values) - 20} more")
         
@@ -305,7 +424,7 @@ class HealthDashboard:
             pause()
             return
         
-        filtered = filter_by_column(df, col_name, value)
+        filtered = self.session.rows_matching(col_name, value)
         self.session.apply_filter(filtered, f"{col_name} = {value}")
         
         log_data_operation(self.logger, "filter",
@@ -318,15 +437,14 @@ class HealthDashboard:
         """Filter by numeric range."""
         df = self.session.get_current_data()
         
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.session.numeric_cols
         if not numeric_cols:
             print("\n[INFO] No numeric columns available")
             pause()
             return
         
         print("\nNumeric columns:")
-        for i, col in enumerate(numeric_cols, 1):
-            print(f"  {i}. {col}")
+        print_numbered(numeric_cols)
         
         col_name = get_user_input("\nEnter column name", "string")
         if not col_name or col_name not in numeric_cols:
@@ -334,7 +452,9 @@ class HealthDashboard:
             pause()
             return
         
-        print(f"\nCurrent range: {df[col_name].min()} to {df[col_name].max()}")
+        value_range = self.session.value_range(col_name)
+        if value_range is not None:
+            print(f"\nCurrent range: {value_range[0]} to {value_range[1]}")
         
         min_val = get_user_input("Enter minimum value (or press Enter to skip)", "float")
         max_val = get_user_input("Enter maximum value (or press Enter to skip)", "float")
@@ -343,7 +463,7 @@ class HealthDashboard:
             pause()
             return
         
-        filtered = filter_by_numeric_range(df, col_name, min_val, max_val)
+        filtered = self.session.rows_in_range(col_name, min_val, max_val)
         filter_desc = f"{col_name}: "
         if min_val is not None:
             filter_desc += f">= {min_val}"
@@ -374,8 +494,7 @@ class HealthDashboard:
         if not self.session.filters_applied:
             print("No filters applied")
         else:
-            for i, filter_desc in enumerate(self.session.filters_applied, 1):
-                print(f"  {i}. {filter_desc}")
+            print_numbered(self.session.filters_applied)
         print()
         pause()
     
@@ -397,28 +516,25 @@ class HealthDashboard:
         print_menu("Analyze Data", options)
         choice = get_user_choice(len(options))
         
-        if choice == 1:
-            self.analyze_column()
-        elif choice == 2:
-            self.analyze_all_numeric()
-        elif choice == 3:
-            self.group_and_aggregate_menu()
-        elif choice == 4:
-            self.trend_analysis_menu()
+        handler = {
+            1: self.analyze_column,
+            2: self.analyze_all_numeric,
+            3: self.group_and_aggregate_menu,
+            4: self.trend_analysis_menu
+        }.get(choice)
+        if handler:
+            handler()
     
     def analyze_column(self):
         """Analyze a specific column."""
-        df = self.session.get_current_data()
-        
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.session.numeric_cols
         if not numeric_cols:
             print("\n[INFO] No numeric columns available")
             pause()
             return
         
         print("\nNumeric columns:")
-        for i, col in enumerate(numeric_cols, 1):
-            print(f"  {i}. {col}")
+        print_numbered(numeric_cols)
         
         col_name = get_user_input("\nEnter column name", "string")
         if not col_name or col_name not in numeric_cols:
@@ -426,14 +542,13 @@ class HealthDashboard:
             pause()
             return
         
-        stats = calculate_summary_stats(df, col_name)
-        display_summary_stats(stats, f"Statistics: {col_name}")
+        stats = self._cached_stats()
+        display_summary_stats(stats[col_name], f"Statistics: {col_name}")
         pause()
     
     def analyze_all_numeric(self):
         """Analyze all numeric columns."""
-        df = self.session.get_current_data()
-        stats = get_column_statistics(df)
+        stats = self._cached_stats()
         
         if not stats:
             print("\n[INFO] No numeric columns found")
@@ -450,19 +565,17 @@ class HealthDashboard:
         df = self.session.get_current_data()
         
         print("\nAvailable columns:")
-        for i, col in enumerate(df.columns, 1):
-            print(f"  {i}. {col}")
+        print_numbered(df.columns)
         
         group_col = get_user_input("\nEnter column to group by", "string")
-        if not group_col or group_col not in df.columns:
+        if not group_col or not self.session.has_column(group_col):
             print("[ERROR] Invalid column name")
             pause()
             return
         
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.session.numeric_cols
         print("\nNumeric columns:")
-        for i, col in enumerate(numeric_cols, 1):
-            print(f"  {i}. {col}")
+        print_numbered(numeric_cols)
         
         agg_col = get_user_input("\nEnter column to aggregate", "string")
         if not agg_col or agg_col not in numeric_cols:
@@ -488,7 +601,43 @@ class HealthDashboard:
     
     def trend_analysis_menu(self):
         """Analyze trends over time."""
-        print("\n[INFO] Trend analysis requires time-series data with date column.")
+        df = self.session.get_current_data()
+        
+        print("\nAvailable columns:")
+        print_numbered(df.columns)
+        
+        time_col = get_user_input("\nEnter time/date column (e.g. year)", "string")
+        if not time_col or not self.session.has_column(time_col):
+            print("[ERROR] Invalid column name")
+            pause()
+            return
+        
+        numeric_cols = self.session.numeric_cols
+        print("\nNumeric columns:")
+        print_numbered(numeric_cols)
+        
+        value_col = get_user_input("\nEnter value column", "string")
+        if not value_col or value_col not in numeric_cols:
+            print("[ERROR] Invalid column name")
+            pause()
+            return
+        
+        group_col = get_user_input("Enter column to compare by (optional, e.g. country)", "string")
+        if group_col and not self.session.has_column(group_col):
+            print("[ERROR] Invalid column name")
+            pause()
+            return
+        
+        try:
+            trends = calculate_period_trends(df, time_col, value_col, group_col or None)
+            display_dataframe(trends, f"{value_col} trend by {time_col}", max_rows=50)
+            
+            if not group_col and confirm_action("Visualize this trend?"):
+                plot_line_chart(trends.astype({time_col: str}), time_col, value_col,
+                                f"{value_col} over {time_col}")
+        except Exception as e:
+            print(f"\n[ERROR] {e}")
+        
         pause()
     
     def visualize_data_menu(self):
@@ -508,29 +657,26 @@ class HealthDashboard:
         print_menu("Visualize Data", options)
         choice = get_user_choice(len(options))
         
-        if choice == 1:
-            self.create_bar_chart()
-        elif choice == 2:
-            self.create_line_chart()
-        elif choice == 3:
-            self.create_grouped_bar_chart()
+        handler = {
+            1: self.create_bar_chart,
+            2: self.create_line_chart,
+            3: self.create_grouped_bar_chart
+        }.get(choice)
+        if handler:
+            handler()
     
     def create_bar_chart(self):
         """Create a bar chart."""
         df = self.session.get_current_data()
         
-        if len(df) > 50:
-            print("\n[WARNING] Too many records for bar chart. Showing first 50.")
-            df = df.head(50)
-        
         print("\nAvailable columns:")
-        for i, col in enumerate(df.columns, 1):
-            print(f"  {i}. {col}")
+        print_numbered(df.columns)
         
         x_col = get_user_input("\nEnter X-axis column", "string")
         y_col = get_user_input("Enter Y-axis column", "string")
         
-        if not x_col or not y_col or x_col not in df.columns or y_col not in df.columns:
+        if not (x_col and y_col and self.session.has_column(x_col)
+                and self.session.has_column(y_col)):
             print("[ERROR] Invalid column names")
             pause()
             return
@@ -540,6 +686,17 @@ class HealthDashboard:
             title = f"{y_col} by {x_col}"
         
         try:
+            if len(df) > 50:
+                if y_col in self.session.numeric_cols and x_col != y_col:
+                    # Sum per category and keep the 50 largest totals, so the
+                    # chart summarizes all rows rather than the first 50
+                    print("\n[INFO] Too many records for bar chart. Showing the 50 largest totals.")
+                    df = (df.groupby(x_col, observed=True, sort=False)[y_col]
+                            .sum().nlargest(50).reset_index())
+                else:
+                    print("\n[WARNING] Too many records for bar chart. Showing first 50.")
+                    df = df.head(50)
+            
             plot_bar_chart(df, x_col, y_col, title)
         except Exception as e:
             print(f"\n[ERROR] Failed to create chart: {e}")
@@ -551,13 +708,13 @@ class HealthDashboard:
         df = self.session.get_current_data()
         
         print("\nAvailable columns:")
-        for i, col in enumerate(df.columns, 1):
-            print(f"  {i}. {col}")
+        print_numbered(df.columns)
         
         x_col = get_user_input("\nEnter X-axis column", "string")
         y_col = get_user_input("Enter Y-axis column", "string")
         
-        if not x_col or not y_col or x_col not in df.columns or y_col not in df.columns:
+        if not (x_col and y_col and self.session.has_column(x_col)
+                and self.session.has_column(y_col)):
             print("[ERROR] Invalid column names")
             pause()
             return
@@ -596,14 +753,14 @@ class HealthDashboard:
         print_menu("Clean Data", options)
         choice = get_user_choice(len(options))
         
-        if choice == 1:
-            self.detect_quality_issues()
-        elif choice == 2:
-            self.handle_missing_values_menu()
-        elif choice == 3:
-            self.remove_duplicates_menu()
-        elif choice == 4:
-            self.apply_cleaning_pipeline()
+        handler = {
+            1: self.detect_quality_issues,
+            2: self.handle_missing_values_menu,
+            3: self.remove_duplicates_menu,
+            4: self.apply_cleaning_pipeline
+        }.get(choice)
+        if handler:
+            handler()
     
     def detect_quality_issues(self):
         """Detect data quality issues."""
@@ -611,23 +768,28 @@ class HealthDashboard:
         
         print_header("Data Quality Report")
         
-        # Missing values
-        missing = detect_missing_values(df)
-        missing_with_issues = missing[missing['missing_count'] > 0]
+        # Missing values: one block-wise null count, reported only for the
+        # columns that have any
+        na_counts = self.session.cached("na_counts", lambda: df.isna().sum())
+        missing_with_issues = na_counts[na_counts > 0]
         
         if len(missing_with_issues) > 0:
             print("Missing Values Found:")
-            print(missing_with_issues.to_string(index=False))
+            print(pd.DataFrame({
+                'column': missing_with_issues.index,
+                'missing_count': missing_with_issues.to_numpy(),
+                'missing_percentage': (missing_with_issues / len(df) * 100).round(2).to_numpy()
+            }).to_string(index=False))
         else:
             print("No missing values found")
         
         # Duplicates
-        duplicates = df.duplicated().sum()
-        print(f"\nDuplicate Rows: {duplicates}")
+        duplicated = self.session.cached("duplicated", df.duplicated)
+        print(f"\nDuplicate Rows: {duplicated.sum()}")
         
         # Data types
         print("\nData Types:")
-        print(df.dtypes.to_string())
+        print(self._dtypes_text())
         
         print()
         pause()
@@ -651,7 +813,7 @@ class HealthDashboard:
         
         try:
             cleaned = handle_missing_values(df, strategy=strategy)
-            self.session.df_filtered = cleaned
+            self.session.set_current_data(cleaned)
             print(f"\n[SUCCESS] Applied {strategy} strategy")
             print(f"Records after cleaning: {len(cleaned)}")
         except Exception as e:
@@ -662,19 +824,22 @@ class HealthDashboard:
     def remove_duplicates_menu(self):
         """Remove duplicate rows."""
         df = self.session.get_current_data()
-        duplicates = df.duplicated().sum()
         
-        print(f"\nFound {duplicates} duplicate rows")
+        # One duplicated() mask, shared with the quality report, gives both
+        # the count and the rows to keep
+        duplicated = self.session.cached("duplicated", df.duplicated)
         
-        if duplicates == 0:
+        if not duplicated.any():
+            print("\nFound 0 duplicate rows")
             print("[INFO] No duplicates to remove")
             pause()
             return
         
+        print(f"\nFound {duplicated.sum()} duplicate rows")
+        
         if confirm_action("Remove duplicates?"):
-            from src.cleaning import remove_duplicates
-            cleaned = remove_duplicates(df)
-            self.session.df_filtered = cleaned
+            cleaned = df[~duplicated.to_numpy()]
+            self.session.set_current_data(cleaned)
             print(f"\n[SUCCESS] Removed {len(df) - len(cleaned)} duplicates")
             print(f"Records remaining: {len(cleaned)}")
         
@@ -689,19 +854,20 @@ class HealthDashboard:
         df = self.session.get_current_data()
         
         try:
-            cleaner = DataCleaner(df)
-            cleaned = (cleaner
-                      .remove_duplicates()
-                      .handle_missing(strategy='drop')
-                      .get_cleaned_data())
+            # Same result as DataCleaner(df).fused_pipeline(), without the
+            # cleaner's defensive copies; the duplicated mask is shared with
+            # the quality report
+            duplicated = self.session.cached("duplicated", df.duplicated).to_numpy()
+            keep = ~(duplicated | df.isna().any(axis=1).to_numpy())
+            cleaned = df[keep]
             
-            report = cleaner.get_cleaning_report()
-            self.session.df_filtered = cleaned
+            n_rows, n_kept = len(df), len(cleaned)
+            self.session.set_current_data(cleaned, categoricalize=True)
             
             print("\n[SUCCESS] Cleaning completed")
-            print(f"Original records: {report['original_rows']}")
-            print(f"Cleaned records: {report['cleaned_rows']}")
-            print(f"Rows removed: {report['rows_removed']}")
+            print(f"Original records: {n_rows}")
+            print(f"Cleaned records: {n_kept}")
+            print(f"Rows removed: {n_rows - n_kept}")
         except Exception as e:
             print(f"\n[ERROR] {e}")
         
@@ -723,10 +889,12 @@ class HealthDashboard:
         print_menu("Export Data", options)
         choice = get_user_choice(len(options))
         
-        if choice == 1:
-            self.export_to_csv_menu()
-        elif choice == 2:
-            self.export_to_database_menu()
+        handler = {
+            1: self.export_to_csv_menu,
+            2: self.export_to_database_menu
+        }.get(choice)
+        if handler:
+            handler()
     
     def export_to_csv_menu(self):
         """Export current data to CSV."""
@@ -747,7 +915,11 @@ class HealthDashboard:
             return
         
         try:
-            load_to_database(df, db_path, table_name)
+            if bulk_export_enabled():
+                stream_to_database(df, db_path, table_name)
+            else:
+                load_to_database(df, db_path, table_name, chunksize=10_000)
+            self._invalidate_db_cache(db_path, table_name)
             log_data_operation(self.logger, "export", 
                              f"Exported {len(df)} records to database",
                              db_path=str(db_path), table=table_name, records=len(df))
@@ -760,7 +932,10 @@ class HealthDashboard:
     
     def database_management_menu(self):
         """Handle database CRUD operations menu."""
-        clear_screen()
+        db_path = get_user_input("Enter database path", "string")
+        if not db_path:
+            return
+        
         options = [
             "List All Tables in Database",
             "View Table Information",
@@ -770,37 +945,41 @@ class HealthDashboard:
             "Delete Record",
             "Execute Custom Query"
         ]
+        handlers = [
+            self.list_tables_menu,
+            self.view_table_info_menu,
+            self.create_record_menu,
+            self.read_records_menu,
+            self.update_record_menu,
+            self.delete_record_menu,
+            self.custom_query_menu
+        ]
         
-        print_menu("Database Management (CRUD)", options)
-        choice = get_user_choice(len(options))
-        
-        if choice == 1:
-            self.list_tables_menu()
-        elif choice == 2:
-            self.view_table_info_menu()
-        elif choice == 3:
-            self.create_record_menu()
-        elif choice == 4:
-            self.read_records_menu()
-        elif choice == 5:
-            self.update_record_menu()
-        elif choice == 6:
-            self.delete_record_menu()
-        elif choice == 7:
-            self.custom_query_menu()
+        # The path is asked for once and every action reuses the engine's
+        # pooled connections, which are kept for later visits until the dashboard exits
+        self._open_databases.add(db_path)
+        while True:
+            clear_screen()
+            print(f"\nDatabase: {db_path}")
+            print_menu("Database Management (CRUD)", options)
+            choice = get_user_choice(len(options))
+            if choice == 0:
+                break
+            handlers[choice - 1](db_path)
+    
+    def close_databases(self):
+        """Close the connections of every database opened from the CRUD menu."""
+        for db_path in self._open_databases:
+            close_database(db_path)
+        self._open_databases.clear()
     
-    def list_tables_menu(self):
+    def list_tables_menu(self, db_path: str):
         """List all tables in a database."""
-        db_path = get_user_input("Enter database path", "string")
-        if not db_path:
-            return
-        
         try:
             tables = list_tables(db_path)
             print_header("Tables in Database")
             if tables:
-                for i, table in enumerate(tables, 1):
-                    print(f"  {i}. {table}")
+                print_numbered(tables)
             else:
                 print("No tables found in database")
             
@@ -814,12 +993,8 @@ class HealthDashboard:
         print()
         pause()
     
-    def view_table_info_menu(self):
+    def view_table_info_menu(self, db_path: str):
         """View information about a table."""
-        db_path = get_user_input("Enter database path", "string")
-        if not db_path:
-            return
-        
         table_name = get_user_input("Enter table name", "string")
         if not table_name:
             return
@@ -843,12 +1018,8 @@ class HealthDashboard:
         print()
         pause()
     
-    def create_record_menu(self):
+    def create_record_menu(self, db_path: str):
         """Create a new record in a database table."""
-        db_path = get_user_input("Enter database path", "string")
-        if not db_path:
-            return
-        
         table_name = get_user_input("Enter table name", "string")
         if not table_name:
             return
@@ -861,22 +1032,12 @@ class HealthDashboard:
                 print(f"  - {col['name']} ({col['type']})")
             
             print("\nEnter values for each column (press Enter to skip):")
+            converters = column_converters(info['columns'])
             record = {}
-            for col in info['columns']:
-                value = get_user_input(f"{col['name']}", "string")
+            for name, convert in converters.items():
+                value = get_user_input(name, "string")
                 if value:
-                    # Try to convert to appropriate type
-                    if 'INT' in col['type'].upper():
-                        try:
-                            value = int(value)
-                        except ValueError:
-                            pass
-                    elif 'REAL' in col['type'].upper() or 'FLOAT' in col['type'].upper():
-                        try:
-                            value = float(value)
-                        except ValueError:
-                            pass
-                    record[col['name']] = value
+                    record[name] = convert(value)
             
             if not record:
                 print("\n[INFO] No data entered")
@@ -885,6 +1046,7 @@ class HealthDashboard:
             
             if confirm_action(f"Create record with {len(record)} fields?"):
                 create_record(db_path, table_name, record)
+                self._invalidate_db_cache(db_path, table_name)
                 log_crud_operation(self.logger, "create", table_name,
                                  f"Created new record with {len(record)} fields",
                                  db_path=str(db_path), record=str(record))
@@ -896,33 +1058,47 @@ class HealthDashboard:
         
         pause()
     
-    def read_records_menu(self):
+    def read_records_menu(self, db_path: str):
         """Read records from a database table."""
-        db_path = get_user_input("Enter database path", "string")
-        if not db_path:
-            return
-        
         table_name = get_user_input("Enter table name", "string")
         if not table_name:
             return
         
         where_clause = get_user_input("Enter WHERE clause (optional, e.g., 'id=1')", "string")
+        columns_str = get_user_input("Enter columns (optional, comma-separated)", "string")
         limit = get_user_input("Enter limit (optional)", "int")
+        columns = [c.strip() for c in columns_str.split(',') if c.strip()] if columns_str else None
         
         try:
-            df = read_records(db_path, table_name, where=where_clause if where_clause else None, 
-                            limit=limit)
+            where = where_clause if where_clause else None
+            
+            # Fetch only what is displayed (plus one row to know if there is
+            # more); the full result is read only if it is loaded
+            max_rows = 50
+            preview_limit = min(limit, max_rows + 1) if limit else max_rows + 1
+            df = read_records(db_path, table_name, where=where, columns=columns,
+                              limit=preview_limit, dtype_backend='pyarrow')
+            complete = len(df) < preview_limit or preview_limit == limit
             
-            display_dataframe(df, f"Records from {table_name}", max_rows=50)
+            display_dataframe(df.iloc[:max_rows], f"Records from {table_name}", max_rows=max_rows)
+            if len(df) > max_rows:
+                print(f"[INFO] More than {max_rows} records match; "
+                      f"showing the first {max_rows}.")
             
             # Optionally load into session
             if len(df) > 0 and confirm_action("\nLoad these records into current session?"):
+                if not complete:
+                    df = read_records(db_path, table_name, where=where, columns=columns,
+                                      limit=limit, dtype_backend='pyarrow')
                 self.session.load_data(df, f"{table_name} (from database)")
                 print("[SUCCESS] Data loaded into session")
             
             log_crud_operation(self.logger, "read", table_name,
                              f"Read {len(df)} records",
                              db_path=str(db_path), where=where_clause or "all")
+            
+            if where_clause:
+                self._offer_filter_index(db_path, table_name, where_clause)
         except Exception as e:
             log_error(self.logger, "read_records", str(e),
                      db_path=str(db_path), table=table_name)
@@ -930,16 +1106,35 @@ class HealthDashboard:
         
         pause()
     
-    def update_record_menu(self):
+    def _offer_filter_index(self, db_path: str, table_name: str, where_clause: str):
+        """Offer to index columns compared with '=' in a WHERE clause, once per column."""
+        candidates = set(re.findall(r'(\w+)\s*=', where_clause))
+        if not candidates:
+            return
+        
+        info = get_table_info(db_path, table_name)
+        columns = {col['name'] for col in info['columns']}
+        candidates = (candidates & columns) - indexed_columns(db_path, table_name)
+        
+        for column in sorted(candidates):
+            key = (db_path, table_name, column)
+            if key in self._index_offered:
+                continue
+            self._index_offered.add(key)
+            
+            if confirm_action(f"\nIndex column '{column}' to speed up future filters on it?"):
+                index_name = create_index(db_path, table_name, column)
+                log_crud_operation(self.logger, "create_index", table_name,
+                                 f"Created index {index_name}",
+                                 db_path=str(db_path), column=column)
+                print(f"[SUCCESS] Created index {index_name}")
+    
+    def update_record_menu(self, db_path: str):
         """Update records in a database table."""
         print("\n[WARNING] Update operations modify the database directly.")
         if not confirm_action("Continue?"):
             return
         
-        db_path = get_user_input("Enter database path", "string")
-        if not db_path:
-            return
-        
         table_name = get_user_input("Enter table name", "string")
         if not table_name:
             return
@@ -969,6 +1164,7 @@ class HealthDashboard:
             
             if confirm_action(f"Update records where {where_clause}?"):
                 rows_affected = update_record(db_path, table_name, updates, where=where_clause)
+                self._invalidate_db_cache(db_path, table_name)
                 log_crud_operation(self.logger, "update", table_name,
                                  f"Updated {rows_affected} records",
                                  db_path=str(db_path), where=where_clause, 
@@ -981,16 +1177,12 @@ class HealthDashboard:
         
         pause()
     
-    def delete_record_menu(self):
+    def delete_record_menu(self, db_path: str):
         """Delete records from a database table."""
         print("\n[WARNING] Delete operations are irreversible!")
         if not confirm_action("Continue?"):
             return
         
-        db_path = get_user_input("Enter database path", "string")
-        if not db_path:
-            return
-        
         table_name = get_user_input("Enter table name", "string")
         if not table_name:
             return
@@ -1002,13 +1194,17 @@ class HealthDashboard:
             return
         
         try:
-            # Show records that will be deleted
-            print("\n[INFO] Records matching the WHERE clause:")
-            df = read_records(db_path, table_name, where=where_clause, limit=10)
-            display_dataframe(df, "Records to Delete", max_rows=10)
+            # The total comes from COUNT(*); rows are only fetched for a
+            # capped preview if the user asks to see them
+            n_matching = count_records(db_path, table_name, where=where_clause)
+            print(f"\n[INFO] {n_matching} record(s) match the WHERE clause.")
+            if n_matching and confirm_action("Preview the matching records?"):
+                df = read_records(db_path, table_name, where=where_clause, limit=10)
+                display_dataframe(df, "Records to Delete", max_rows=10)
             
-            if confirm_action(f"\nDelete {len(df)} record(s)?"):
+            if confirm_action(f"\nDelete {n_matching} record(s)?"):
                 rows_affected = delete_record(db_path, table_name, where=where_clause)
+                self._invalidate_db_cache(db_path, table_name)
                 log_crud_operation(self.logger, "delete", table_name,
                                  f"Deleted {rows_affected} records",
                                  db_path=str(db_path), where=where_clause)
@@ -1020,27 +1216,37 @@ class HealthDashboard:
         
         pause()
     
-    def custom_query_menu(self):
+    def custom_query_menu(self, db_path: str):
         """Execute a custom SQL query."""
         print("\n[INFO] Execute custom SQL query on database.")
-        db_path = get_user_input("Enter database path", "string")
-        if not db_path:
-            return
-        
         table_name = get_user_input("Enter table name", "string")
         if not table_name:
             return
         
         query = get_user_input("Enter SQL query (SELECT only)", "string")
-        if not query or not query.strip().upper().startswith('SELECT'):
-            print("\n[ERROR] Only SELECT queries are allowed for safety")
+        if not query:
+            return
+        try:
+            validate_select_query(db_path, query)
+        except (ValueError, FileNotFoundError) as e:
+            print(f"\n[ERROR] {e}")
             pause()
             return
         
         try:
             from src.main import read_from_database
-            df = read_from_database(db_path, table_name, query=query)
-            display_dataframe(df, "Query Results", max_rows=50)
+            
+            # Fetch one row past the display limit so SQLite can stop early
+            # and we can still tell whether rows were left out
+            max_rows = 50
+            # The newline ends a trailing "-- comment" before the closing paren
+            limited = (f"SELECT * FROM ({query.strip().rstrip(';')}\n) AS _sub "
+                       f"LIMIT {max_rows + 1}")
+            df = read_from_database(db_path, table_name, query=limited)
+            display_dataframe(df.iloc[:max_rows], "Query Results", max_rows=max_rows)
+            if len(df) > max_rows:
+                print(f"[INFO] The query returned more than {max_rows} rows; "
+                      f"only the first {max_rows} were fetched.")
             
             log_crud_operation(self.logger, "read", table_name,
                              "Executed custom query",
@@ -1065,35 +1271,39 @@ class HealthDashboard:
         print_menu("Activity Log", options)
         choice = get_user_choice(len(options))
         
-        if choice == 1:
-            self.view_recent_activities()
-        elif choice == 2:
-            self.view_activity_statistics()
-        elif choice == 3:
-            self.filter_activities_menu()
-        elif choice == 4:
-            self.export_activity_log_menu()
+        # Every option reads the log file, so write out queued records first
+        self.logger.flush()
+        
+        handler = {
+            1: self.view_recent_activities,
+            2: self.view_activity_statistics,
+            3: self.filter_activities_menu,
+            4: self.export_activity_log_menu
+        }.get(choice)
+        if handler:
+            handler()
     
     def view_recent_activities(self):
         """View recent activities from the log."""
         try:
             from src.activity_logger import read_activity_log
-            activities = read_activity_log(self.logger.log_file)
-            
             # Show last 20 activities
-            recent = activities[-20:] if len(activities) > 20 else activities
+            recent = read_activity_log(self.logger.log_file, tail=20)
             recent.reverse()  # Most recent first
             
             print_header("Recent Activities")
+            # Build the listing and write it once instead of three prints per entry
+            lines = []
             for i, activity in enumerate(recent, 1):
                 timestamp = activity.get('timestamp', 'N/A')
                 action = activity.get('action', 'N/A')
                 desc = activity.get('description', 'N/A')
                 level = activity.get('level', 'INFO')
                 
-                print(f"\n{i}. [{level}] {timestamp[:19]}")
-                print(f"   Action: {action}")
-                print(f"   Details: {desc}")
+                lines.append(f"\n{i}. [{level}] {timestamp[:19]}\n"
+                             f"   Action: {action}\n"
+                             f"   Details: {desc}\n")
+            sys.stdout.write(''.join(lines))
         except Exception as e:
             print(f"\n[ERROR] Failed to read activity log: {e}")
         
@@ -1114,9 +1324,10 @@ class HealthDashboard:
                 print(f"  Last:  {stats['date_range']['last'][:19]}")
             
             print(f"\nTop Actions:")
-            sorted_actions = sorted(stats['action_counts'].items(), 
-                                  key=lambda x: x[1], reverse=True)
-            for action, count in sorted_actions[:10]:
+            # Only the ten most common are shown, so no full sort is needed
+            top_actions = heapq.nlargest(10, stats['action_counts'].items(),
+                                         key=lambda x: x[1])
+            for action, count in top_actions:
                 print(f"  {action}: {count}")
             
             print(f"\nSeverity Levels:")
@@ -1143,13 +1354,15 @@ class HealthDashboard:
             )
             
             print_header(f"Filtered Activities ({len(filtered)} found)")
+            lines = []
             for i, activity in enumerate(filtered[-20:], 1):  # Show last 20
                 timestamp = activity.get('timestamp', 'N/A')
                 action = activity.get('action', 'N/A')
                 desc = activity.get('description', 'N/A')
                 
-                print(f"\n{i}. {timestamp[:19]} - {action}")
-                print(f"   {desc}")
+                lines.append(f"\n{i}. {timestamp[:19]} - {action}\n"
+                             f"   {desc}\n")
+            sys.stdout.write(''.join(lines))
         except Exception as e:
             print(f"\n[ERROR] {e}")
         
@@ -1178,11 +1391,15 @@ class HealthDashboard:
         clear_screen()
         print_header("Thank You for Using Public Health Data Dashboard!")
         print("\nGoodbye!\n")
+        self.logger.flush()
+        self.close_databases()
+        dispose_engines()
         self.running = False
 
 
 def main():
     """Main entry point for the dashboard."""
+    logging.basicConfig(level=logging.WARNING, format="[%(levelname)s] %(message)s")
     dashboard = HealthDashboard()
     dashboard.run()
 
@@ -10,10 +10,14 @@ This module demonstrates loading data from various sources:
 This is a practical demonstration for the public health data dashboard.
 """
 
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import pandas as pd
 
+from src.fast_io import fast_io_enabled
 from src.main import (
     load_dataset,
     load_json_dataset,
@@ -22,6 +26,11 @@ from src.main import (
 )
 
 
+def _report(message: str) -> None:
+    """Print a progress line in one write, so concurrent loads don't interleave."""
+    sys.stdout.write(message + "\n")
+
+
 class DataLoader:
     """
     Main data loader class for the public health dashboard.
@@ -44,9 +53,9 @@ class DataLoader:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
     
-    def load_vaccination_data(self, csv_path: Optional[Path] = None) -> pd.DataFrame:
+    def read_vaccination_data(self, csv_path: Optional[Path] = None) -> pd.DataFrame:
         """
-        Load vaccination data from CSV file.
+        Parse vaccination data from a CSV file without storing it.
         
         Parameters
         ----------
@@ -61,19 +70,15 @@ class DataLoader:
         if csv_path is None:
             csv_path = Path("data/sample_vaccination_data.csv")
         
-        print(f"Loading vaccination data from {csv_path}...")
-        df = load_dataset(csv_path)
-        print(f"[OK] Loaded {len(df)} vaccination records")
-        
-        # Store in database
-        load_to_database(df, self.db_path, "vaccinations", if_exists="replace")
-        print(f"[OK] Stored vaccination data in database: {self.db_path}")
-        
+        _report(f"Loading vaccination data from {csv_path}...")
+        # HEALTH_FAST_IO routes the parse through the Arrow-based readers
+        df = load_dataset(csv_path, fast=fast_io_enabled())
+        _report(f"[OK] Loaded {len(df)} vaccination records")
         return df
     
-    def load_outbreak_data(self, json_path: Optional[Path] = None) -> pd.DataFrame:
+    def read_outbreak_data(self, json_path: Optional[Path] = None) -> pd.DataFrame:
         """
-        Load disease outbreak data from JSON file.
+        Parse disease outbreak data from a JSON file without storing it.
         
         Parameters
         ----------
@@ -88,14 +93,65 @@ class DataLoader:
         if json_path is None:
             json_path = Path("data/sample_disease_outbreak.json")
         
-        print(f"Loading outbreak data from {json_path}...")
+        _report(f"Loading outbreak data from {json_path}...")
         df = load_json_dataset(json_path)
-        print(f"[OK] Loaded {len(df)} outbreak records")
+        _report(f"[OK] Loaded {len(df)} outbreak records")
+        return df
+    
+    def store_data(self, df: pd.DataFrame, table_name: str, label: str) -> None:
+        """
+        Replace a database table with a DataFrame.
+        
+        SQLite locks the whole database file for a write, so tables of the
+        same database should be stored one after the other, not from
+        concurrent threads.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Data to store
+        table_name : str
+            Name of the table to replace
+        label : str
+            Name of the data used in the progress message
+        """
+        load_to_database(df, self.db_path, table_name, if_exists="replace", bulk=True)
+        _report(f"[OK] Stored {label} data in database: {self.db_path}")
+    
+    def load_vaccination_data(self, csv_path: Optional[Path] = None) -> pd.DataFrame:
+        """
+        Load vaccination data from CSV file.
+        
+        Parameters
+        ----------
+        csv_path : Path, optional
+            Path to vaccination CSV file. Defaults to sample data.
         
-        # Store in database
-        load_to_database(df, self.db_path, "outbreaks", if_exists="replace")
-        print(f"[OK] Stored outbreak data in database: {self.db_path}")
+        Returns
+        -------
+        pd.DataFrame
+            Vaccination data as DataFrame
+        """
+        df = self.read_vaccination_data(csv_path)
+        self.store_data(df, "vaccinations", "vaccination")
+        return df
+    
+    def load_outbreak_data(self, json_path: Optional[Path] = None) -> pd.DataFrame:
+        """
+        Load disease outbreak data from JSON file.
+        
+        Parameters
+        ----------
+        json_path : Path, optional
+            Path to outbreak JSON file. Defaults to sample data.
         
+        Returns
+        -------
+        pd.DataFrame
+            Outbreak data as DataFrame
+        """
+        df = self.read_outbreak_data(json_path)
+        self.store_data(df, "outbreaks", "outbreak")
         return df
     
     def get_data_from_db(self, table_name: str, 
@@ -124,21 +180,26 @@ class DataLoader:
         """
         Display a summary of all data loaded in the database.
         """
-        from sqlalchemy import create_engine, inspect
-        
-        engine = create_engine(f'sqlite:///{self.db_path}')
-        inspector = inspect(engine)
-        
         print("\n" + "="*60)
         print("DATABASE SUMMARY")
         print("="*60)
         print(f"Database: {self.db_path}")
         print(f"\nTables:")
         
-        for table_name in inspector.get_table_names():
-            df = read_from_database(self.db_path, table_name)
-            print(f"  - {table_name}: {len(df)} records, {len(df.columns)} columns")
-            print(f"    Columns: {', '.join(df.columns)}")
+        # Row counts and column names come from SQLite; no table is read
+        conn = sqlite3.connect(self.db_path)
+        try:
+            tables = [row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+            for table_name in tables:
+                quoted = '"' + table_name.replace('"', '""') + '"'
+                columns = [row[1] for row in conn.execute(f"PRAGMA table_info({quoted})")]
+                n_rows = conn.execute(f"SELECT COUNT(*) FROM {quoted}").fetchone()[0]
+                print(f"  - {table_name}: {n_rows} records, {len(columns)} columns")
+                print(f"    Columns: {', '.join(columns)}")
+        finally:
+            conn.close()
         
         print("="*60 + "\n")
 
@@ -154,17 +215,24 @@ def main():
     # Initialize data loader
     loader = DataLoader()
     
-    # Load vaccination data from CSV
+    # The two files are parsed concurrently; the database writes then run
+    # one after the other on this thread, since SQLite allows one writer
     print("Step 1: Loading vaccination data from CSV...")
-    vaccination_df = loader.load_vaccination_data()
+    print("Step 2: Loading outbreak data from JSON...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        vaccination_future = executor.submit(loader.read_vaccination_data)
+        outbreak_future = executor.submit(loader.read_outbreak_data)
+        vaccination_df = vaccination_future.result()
+        outbreak_df = outbreak_future.result()
+    
+    loader.store_data(vaccination_df, "vaccinations", "vaccination")
+    loader.store_data(outbreak_df, "outbreaks", "outbreak")
+    
     print(f"\nFirst few vaccination records:")
     print(vaccination_df.head(3))
     print()
     
-    # Load outbreak data from JSON
     print("\n" + "-"*60)
-    print("Step 2: Loading outbreak data from JSON...")
-    outbreak_df = loader.load_outbreak_data()
     print(f"\nFirst few outbreak records:")
     print(outbreak_df.head(3))
     print()
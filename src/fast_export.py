@@ -0,0 +1,144 @@
+"""
+Streaming Export - Chunked Writers for Large DataFrames
+
+This module provides exporters that format and write data in row chunks
+so peak memory stays proportional to the chunk size, not the frame:
+- CSV export written block by block to a buffered file handle
+- SQLite export written in one transaction with batched executemany
+
+The bulk database writer is opt-in via the HEALTH_BULK_EXPORT environment
+variable.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Union
+import pandas as pd
+
+
+def bulk_export_enabled() -> bool:
+    """Check whether the HEALTH_BULK_EXPORT environment flag is set."""
+    return os.environ.get("HEALTH_BULK_EXPORT", "").strip().lower() in ("1", "true", "yes")
+
+
+def stream_to_csv(df: pd.DataFrame, path: Union[str, Path],
+                  chunksize: int = 50_000) -> int:
+    """
+    Write a DataFrame to CSV in row chunks.
+
+    Each chunk is formatted and written before the next is started, through
+    a single file handle with a 1 MiB buffer, so formatting and disk writes
+    overlap and no full-size CSV string is ever built.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data to export.
+    path : str or pathlib.Path
+        Destination CSV file. Parent directories are created if needed.
+    chunksize : int, default 50_000
+        Number of rows formatted per block.
+
+    Returns
+    -------
+    int
+        Number of data rows written.
+
+    Examples
+    --------
+    >>> stream_to_csv(df, "outputs/export.csv")
+    120000
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    n_rows = len(df)
+    with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        if n_rows == 0:
+            df.to_csv(f, index=False)
+        for start in range(0, n_rows, chunksize):
+            df.iloc[start:start + chunksize].to_csv(f, index=False, header=(start == 0))
+    
+    return n_rows
+
+
+def _to_sql_values(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Convert a chunk to Python objects sqlite3 can bind, with NULL for NaN."""
+    chunk = chunk.copy()
+    for col in chunk.select_dtypes(include=['datetime', 'datetimetz']).columns:
+        chunk[col] = chunk[col].dt.strftime('%Y-%m-%d %H:%M:%S.%f')
+    return chunk.astype(object).where(chunk.notna(), None)
+
+
+def stream_to_database(df: pd.DataFrame, db_path: Union[str, Path], table_name: str,
+                       if_exists: str = 'replace', chunksize: int = 10_000) -> int:
+    """
+    Write a DataFrame to a SQLite table in one batched transaction.
+
+    The table schema is created by pandas from the column dtypes; the rows
+    are then inserted through the sqlite3 driver with one ``executemany``
+    per chunk inside a single ``BEGIN IMMEDIATE`` transaction, so the
+    journal is synced once for the whole export instead of once per batch.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data to export.
+    db_path : str or pathlib.Path
+        Path to the SQLite database file.
+    table_name : str
+        Name of the table to create/update.
+    if_exists : str, default 'replace'
+        How to behave if the table exists: 'fail', 'replace', or 'append'.
+    chunksize : int, default 10_000
+        Number of rows passed to each executemany call.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+
+    Raises
+    ------
+    ValueError
+        If the DataFrame is empty or table_name is invalid.
+
+    Examples
+    --------
+    >>> stream_to_database(df, "data/health.db", "vaccinations")
+    120000
+    """
+    from src.crud import invalidate_table_cache
+    from src.main import get_engine
+    
+    if df.empty:
+        raise ValueError("Cannot load empty DataFrame to database")
+    
+    if not table_name or not isinstance(table_name, str):
+        raise ValueError("Invalid table name")
+    
+    # Let pandas map dtypes to column types, then fill the table directly
+    df.head(0).to_sql(table_name, get_engine(db_path), if_exists=if_exists, index=False)
+    
+    quoted = ", ".join('"' + str(col).replace('"', '""') + '"' for col in df.columns)
+    placeholders = ", ".join("?" for _ in df.columns)
+    table = table_name.replace('"', '""')
+    statement = f'INSERT INTO "{table}" ({quoted}) VALUES ({placeholders})'
+    
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for start in range(0, len(df), chunksize):
+                chunk = _to_sql_values(df.iloc[start:start + chunksize])
+                conn.executemany(statement, chunk.itertuples(index=False, name=None))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+        invalidate_table_cache(db_path)
+    
+    return len(df)
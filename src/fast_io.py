@@ -0,0 +1,74 @@
+"""
+Fast CSV Loading - Optional Accelerated Readers
+
+This module provides a CSV reader that uses multithreaded Arrow-based
+parsers when they are installed:
+- polars (preferred)
+- pyarrow
+- pandas (always available fallback)
+
+The fast path is opt-in via the HEALTH_FAST_IO environment variable.
+"""
+
+import os
+from pathlib import Path
+from typing import Union
+import pandas as pd
+
+
+def fast_io_enabled() -> bool:
+    """Check whether the HEALTH_FAST_IO environment flag is set."""
+    return os.environ.get("HEALTH_FAST_IO", "").strip().lower() in ("1", "true", "yes")
+
+
+def read_csv_fast(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Read a CSV file with the fastest available parser.
+
+    Tries polars, then pyarrow's CSV reader, then pandas. The result may
+    use Arrow-backed dtypes (e.g. ``string[pyarrow]``), which the rest of
+    the dashboard handles like the regular pandas dtypes.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path to the CSV file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame containing the loaded data.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified file does not exist.
+    ValueError
+        If the file cannot be parsed as CSV.
+    """
+    path = Path(path)
+    
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    
+    try:
+        import polars as pl
+        import pyarrow  # noqa: F401  (needed for Arrow-backed conversion)
+        return pl.read_csv(path).to_pandas(use_pyarrow_extension_array=True)
+    except ImportError:
+        pass
+    except Exception as e:
+        raise ValueError(f"Error reading CSV file: {e}")
+    
+    try:
+        from pyarrow import csv as pa_csv
+        return pa_csv.read_csv(path).to_pandas(split_blocks=True, self_destruct=True)
+    except ImportError:
+        pass
+    except Exception as e:
+        raise ValueError(f"Error reading CSV file: {e}")
+    
+    try:
+        return pd.read_csv(path)
+    except Exception as e:
+        raise ValueError(f"Error reading CSV file: {e}")
@@ -9,6 +9,7 @@ Step 4: Presentation Layer - GUI Implementation
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
+import tkinter.font as tkfont
 from pathlib import Path
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -28,6 +29,10 @@ from src.crud import CRUDManager, list_tables
 from src.activity_logger import ActivityLogger, get_activity_stats
 
 
+# Pixels added to the font's line height for each data table row
+TABLE_ROW_PADDING = 4
+
+
 class HealthDashboardGUI:
     """
     Graphical User Interface for Public Health Data Dashboard.
@@ -52,6 +57,7 @@ class HealthDashboardGUI:
         self.root.minsize(1000, 700)
         
         # Data storage
+        self._numeric_cols = []
         self.df = None
         self.df_original = None
         self.current_source = "No data loaded"
@@ -68,6 +74,22 @@ class HealthDashboardGUI:
         self.logger.log("session_start", "GUI Dashboard started")
         self.add_log("Dashboard started. Welcome!")
     
+    @property
+    def df(self):
+        """Currently displayed DataFrame."""
+        return self._df
+    
+    @df.setter
+    def df(self, value):
+        """Set the displayed DataFrame and record its numeric columns once."""
+        self._df = value
+        self._numeric_cols = ([] if value is None
+                              else value.select_dtypes(include=['number']).columns.tolist())
+    
+    def numeric_columns(self):
+        """Return the numeric column names of the current data (cached on assignment)."""
+        return list(self._numeric_cols)
+    
     def setup_ui(self):
         """Setup the user interface."""
         # Configure style
@@ -276,17 +298,35 @@ class HealthDashboardGUI:
     
     def setup_table_tab(self):
         """Setup the data table tab."""
-        # Create Treeview for data display
-        tree_scroll = ttk.Scrollbar(self.table_frame)
-        tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        
+        # Create Treeview for data display. The tree holds only the rows in
+        # view; the scrollbar moves a window over the whole DataFrame and the
+        # items are refilled from it
+        self.tree_scroll = ttk.Scrollbar(self.table_frame, command=self._on_table_scroll)
+        self.tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Row height follows the font, in a style of its own so other
+        # Treeviews keep the theme default
+        style = ttk.Style()
+        row_font = tkfont.Font(font=style.lookup('Treeview', 'font') or 'TkDefaultFont')
+        self._row_height = row_font.metrics('linespace') + TABLE_ROW_PADDING
+        style.configure('Data.Treeview', rowheight=self._row_height)
         self.tree = ttk.Treeview(
             self.table_frame,
-            yscrollcommand=tree_scroll.set,
+            style='Data.Treeview',
             selectmode='browse'
         )
         self.tree.pack(fill=tk.BOTH, expand=True)
-        tree_scroll.config(command=self.tree.yview)
+        
+        self._view_df = None
+        self._first_row = 0
+        self._shown_first = 0
+        self._selection_row = None
+        self._refresh_pending = False
+        self.tree.bind('<Configure>', lambda event: self._schedule_table_refresh())
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self._on_table_wheel)
+        for sequence in ('<Up>', '<Down>', '<Prior>', '<Next>'):
+            self.tree.bind(sequence, self._on_table_key)
         
         # Info label
         self.data_info_label = ttk.Label(
@@ -429,8 +469,7 @@ class HealthDashboardGUI:
             return
         
         # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         
         # Setup columns
         self.tree['columns'] = list(self.df.columns)
@@ -440,15 +479,133 @@ class HealthDashboardGUI:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=100)
         
-        # Add data (first 1000 rows for performance)
-        for idx, row in self.df.head(1000).iterrows():
-            self.tree.insert('', tk.END, values=list(row))
+        # Add data: only the visible window is drawn, so every row is reachable
+        self._view_df = self.df
+        self._first_row = 0
+        self._selection_row = None
+        self._refresh_visible_rows()
         
         # Update info
-        info_text = f"Showing {min(len(self.df), 1000)} of {len(self.df)} records | "
+        info_text = f"Showing {len(self.df)} records | "
         info_text += f"{len(self.df.columns)} columns | Source: {self.current_source}"
         self.data_info_label.config(text=info_text)
     
+    def _visible_row_count(self):
+        """Number of table rows that fit in the tree's current height."""
+        # The first item starts right below the heading; until one is
+        # drawn, assume the heading is one row tall
+        items = self.tree.get_children()
+        bbox = self.tree.bbox(items[0]) if items else None
+        header_height = bbox[1] if bbox else self._row_height
+        height = self.tree.winfo_height() - header_height
+        return max(1, height // self._row_height)
+    
+    def _selected_row(self):
+        """DataFrame position of the selected row, or None."""
+        selection = self.tree.selection()
+        if not selection:
+            # Kept while the selected row is scrolled out of view
+            return self._selection_row
+        return self._shown_first + self.tree.index(selection[0])
+    
+    def _select_row(self, row):
+        """Select DataFrame position ``row``; its item is highlighted while in view."""
+        self._selection_row = row
+        items = self.tree.get_children()
+        if row is not None and 0 <= row - self._shown_first < len(items):
+            item = items[row - self._shown_first]
+            self.tree.selection_set(item)
+            self.tree.focus(item)
+        elif self.tree.selection():
+            self.tree.selection_remove(self.tree.selection())
+    
+    def _on_table_scroll(self, *args):
+        """Scrollbar command: move the row window ('moveto' or 'scroll' units/pages)."""
+        if self._view_df is None:
+            return
+        
+        if args[0] == 'moveto':
+            first = int(float(args[1]) * len(self._view_df))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._visible_row_count()
+            first = self._first_row + step
+        else:
+            return
+        
+        self._first_row = first
+        self._schedule_table_refresh()
+    
+    def _on_table_wheel(self, event):
+        """Scroll the row window by three rows per wheel step."""
+        up = event.num == 4 or event.delta > 0
+        self._first_row += -3 if up else 3
+        self._schedule_table_refresh()
+        return 'break'
+    
+    def _on_table_key(self, event):
+        """Move the selection a row or a page, scrolling the window at its edges."""
+        df = self._view_df
+        if df is None or df.empty:
+            return 'break'
+        
+        visible = min(self._visible_row_count(), len(df))
+        step = {'Up': -1, 'Down': 1, 'Prior': -visible, 'Next': visible}[event.keysym]
+        current = self._selected_row()
+        row = self._shown_first if current is None else current + step
+        row = max(0, min(row, len(df) - 1))
+        
+        first = max(0, min(self._first_row, len(df) - visible))
+        if row < first:
+            first = row
+        elif row >= first + visible:
+            first = row - visible + 1
+        self._first_row = first
+        
+        self._refresh_visible_rows()
+        self._select_row(row)
+        return 'break'
+    
+    def _schedule_table_refresh(self):
+        """Refill the visible rows once the event queue is idle (coalesces bursts)."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.tree.after_idle(self._refresh_visible_rows)
+    
+    def _refresh_visible_rows(self):
+        """Show the window of rows starting at ``_first_row`` in the tree."""
+        self._refresh_pending = False
+        df = self._view_df
+        if df is None:
+            return
+        
+        # The selection follows its DataFrame row, not its slot in the tree
+        selected = self._selected_row()
+        
+        n_rows = len(df)
+        visible = min(self._visible_row_count(), n_rows)
+        first = max(0, min(self._first_row, n_rows - visible))
+        self._first_row = first
+        
+        # One conversion for the whole window instead of boxing row by row
+        values = df.iloc[first:first + visible].to_numpy(dtype=object).tolist()
+        
+        # Reuse the existing items; only the difference is inserted or deleted
+        items = self.tree.get_children()
+        for item, row in zip(items, values):
+            self.tree.item(item, values=row)
+        for row in values[len(items):]:
+            self.tree.insert('', tk.END, values=row)
+        if len(items) > len(values):
+            self.tree.delete(*items[len(values):])
+        
+        self._shown_first = first
+        self._select_row(selected)
+        
+        if n_rows:
+            self.tree_scroll.set(first / n_rows, (first + visible) / n_rows)
+    
     def view_data(self):
         """Switch to data table view."""
         if self.df is None:
@@ -473,7 +630,7 @@ class HealthDashboardGUI:
         self.stats_text.insert(tk.END, f"Columns: {len(self.df.columns)}\n\n")
         
         # Describe numeric columns
-        numeric_cols = self.df.select_dtypes(include=['number']).columns
+        numeric_cols = self.numeric_columns()
         if len(numeric_cols) > 0:
             self.stats_text.insert(tk.END, "Numeric Column Statistics:\n")
             self.stats_text.insert(tk.END, "-"*60 + "\n")
@@ -482,8 +639,8 @@ class HealthDashboardGUI:
         # Column types
         self.stats_text.insert(tk.END, "Column Data Types:\n")
         self.stats_text.insert(tk.END, "-"*60 + "\n")
-        for col in self.df.columns:
-            self.stats_text.insert(tk.END, f"{col}: {self.df[col].dtype}\n")
+        self.stats_text.insert(tk.END, "".join(
+            f"{col}: {dtype}\n" for col, dtype in self.df.dtypes.items()))
         
         self.notebook.select(self.stats_frame)
         self.logger.log("analysis", "Viewed summary statistics")
@@ -500,8 +657,8 @@ class HealthDashboardGUI:
         info += f"Total Records: {len(self.df)}\n"
         info += f"Total Columns: {len(self.df.columns)}\n\n"
         info += f"Columns:\n"
-        for col in self.df.columns:
-            info += f"  • {col} ({self.df[col].dtype})\n"
+        for col, dtype in self.df.dtypes.items():
+            info += f"  • {col} ({dtype})\n"
         
         messagebox.showinfo("Data Information", info)
     
@@ -548,7 +705,7 @@ class HealthDashboardGUI:
             messagebox.showinfo("No Data", "Please load data first.")
             return
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.numeric_columns()
         if not numeric_cols:
             messagebox.showinfo("No Numeric Columns", "No numeric columns available for filtering.")
             return
@@ -626,7 +783,7 @@ class HealthDashboardGUI:
         group_combo = ttk.Combobox(dialog, textvariable=group_var, values=list(self.df.columns))
         group_combo.pack(pady=5)
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.numeric_columns()
         ttk.Label(dialog, text="Aggregate Column:").pack(pady=5)
         agg_var = tk.StringVar()
         agg_combo = ttk.Combobox(dialog, textvariable=agg_var, values=numeric_cols)
@@ -676,7 +833,7 @@ class HealthDashboardGUI:
         x_combo = ttk.Combobox(dialog, textvariable=x_var, values=list(self.df.columns))
         x_combo.pack(pady=5)
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.numeric_columns()
         ttk.Label(dialog, text="Y-axis (Value):").pack(pady=5)
         y_var = tk.StringVar()
         y_combo = ttk.Combobox(dialog, textvariable=y_var, values=numeric_cols)
@@ -735,7 +892,7 @@ class HealthDashboardGUI:
         x_combo = ttk.Combobox(dialog, textvariable=x_var, values=list(self.df.columns))
         x_combo.pack(pady=5)
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.numeric_columns()
         ttk.Label(dialog, text="Y-axis:").pack(pady=5)
         y_var = tk.StringVar()
         y_combo = ttk.Combobox(dialog, textvariable=y_var, values=numeric_cols)
@@ -800,8 +957,8 @@ class HealthDashboardGUI:
                 report += "✅ No missing values found\n\n"
             
             report += "Column Data Types:\n"
-            for col in self.df.columns:
-                report += f"  • {col}: {self.df[col].dtype}\n"
+            for col, dtype in self.df.dtypes.items():
+                report += f"  • {col}: {dtype}\n"
             
             messagebox.showinfo("Quality Report", report)
             self.logger.log("data_cleaned", "Detected data quality issues")
@@ -815,14 +972,15 @@ class HealthDashboardGUI:
             messagebox.showinfo("No Data", "Please load data first.")
             return
         
-        duplicates = self.df.duplicated().sum()
+        # One hash pass gives both the count and the rows to keep
+        duplicated = self.df.duplicated().to_numpy()
+        duplicates = int(duplicated.sum())
         if duplicates == 0:
             messagebox.showinfo("No Duplicates", "No duplicate rows found.")
             return
         
         if messagebox.askyesno("Confirm", f"Remove {duplicates} duplicate rows?"):
-            original_count = len(self.df)
-            self.df = self.df.drop_duplicates()
+            self.df = self.df[~duplicated]
             self.logger.log("data_cleaned", f"Removed {duplicates} duplicates")
             self.add_log(f"🗑️ Removed {duplicates} duplicate rows ({len(self.df)} remaining)")
             self.update_table()
@@ -1022,7 +1180,7 @@ class HealthDashboardGUI:
             messagebox.showinfo("No Data", "Please load data first.")
             return
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns
+        numeric_cols = self.numeric_columns()
         if len(numeric_cols) < 2:
             messagebox.showinfo("Insufficient Columns", "Need at least 2 numeric columns.")
             return
@@ -1112,7 +1270,7 @@ class HealthDashboardGUI:
             messagebox.showinfo("No Data", "Please load data first.")
             return
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.numeric_columns()
         if not numeric_cols:
             messagebox.showinfo("No Numeric Columns", "No numeric columns available.")
             return
@@ -1185,7 +1343,7 @@ class HealthDashboardGUI:
         cat_combo = ttk.Combobox(dialog, textvariable=cat_var, values=list(self.df.columns))
         cat_combo.pack(pady=5)
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.numeric_columns()
         ttk.Label(dialog, text="Value Column (optional):").pack(pady=5)
         val_var = tk.StringVar()
         val_combo = ttk.Combobox(dialog, textvariable=val_var, values=['Count'] + numeric_cols)
@@ -1241,7 +1399,7 @@ class HealthDashboardGUI:
             messagebox.showinfo("No Data", "Please load data first.")
             return
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self.numeric_columns()
         if len(numeric_cols) < 2:
             messagebox.showinfo("Insufficient Columns", "Need at least 2 numeric columns.")
             return
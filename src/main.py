@@ -4,16 +4,61 @@ Entry point for the Public Health Data Insights Dashboard (Task 1).
 Step 1: Data Access & Loading - Load data from CSV, JSON, and APIs.
 """
 
-import json
+import os
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Union, Optional
+from typing import Dict, Union, Optional
 import pandas as pd
 import requests
 from sqlalchemy import create_engine, inspect
 from sqlalchemy.engine import Engine
+from src.crud import invalidate_table_cache
 
 
-def load_dataset(path: Union[str, Path]) -> pd.DataFrame:
+# Engines per resolved database path, reused for the whole session
+_ENGINE_CACHE: Dict[str, Engine] = {}
+_ENGINE_LOCK = threading.Lock()
+
+# Bound-parameter limit per statement, which caps multi-row INSERT batches
+_SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+
+def get_engine(db_path: Union[str, Path]) -> Engine:
+    """
+    Return the shared SQLAlchemy engine for a SQLite database file.
+
+    Engines (and their connection pools) are created once per database
+    and reused, so repeated imports and exports skip connection setup.
+
+    Parameters
+    ----------
+    db_path : str or pathlib.Path
+        Path to the SQLite database file.
+
+    Returns
+    -------
+    sqlalchemy.engine.Engine
+        Database engine for the file.
+    """
+    key = str(Path(db_path).resolve())
+    with _ENGINE_LOCK:
+        engine = _ENGINE_CACHE.get(key)
+        if engine is None:
+            engine = create_engine(f'sqlite:///{key}', pool_pre_ping=True, pool_size=4)
+            _ENGINE_CACHE[key] = engine
+    return engine
+
+
+def dispose_engines() -> None:
+    """Close the connections of all shared engines and forget them."""
+    with _ENGINE_LOCK:
+        for engine in _ENGINE_CACHE.values():
+            engine.dispose()
+        _ENGINE_CACHE.clear()
+
+
+def load_dataset(path: Union[str, Path], fast: bool = False) -> pd.DataFrame:
     """
     Load a public health dataset from a CSV file.
 
@@ -21,6 +66,10 @@ def load_dataset(path: Union[str, Path]) -> pd.DataFrame:
     ----------
     path : str or pathlib.Path
         Path to the CSV file.
+    fast : bool, default False
+        If True, parse with the multithreaded polars or pyarrow reader when
+        one is installed (see ``src.fast_io.read_csv_fast``), falling back
+        to the pandas C parser otherwise.
 
     Returns
     -------
@@ -39,6 +88,10 @@ def load_dataset(path: Union[str, Path]) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
+    if fast:
+        from src.fast_io import read_csv_fast
+        return read_csv_fast(path)
+    
     try:
         df = pd.read_csv(path)
         return df
@@ -72,13 +125,36 @@ def load_json_dataset(path: Union[str, Path]) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
+    # orjson parses straight from bytes when it is installed; otherwise
+    # pandas' bundled ujson parser is still faster than the stdlib json
+    # module (precise_float keeps float parsing identical to json.load)
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        df = pd.DataFrame(data)
-        return df
-    except json.JSONDecodeError as e:
+        import orjson
+    except ImportError:
+        orjson = None
+    
+    try:
+        raw = path.read_bytes()
+    except Exception as e:
+        raise ValueError(f"Error reading JSON file: {e}")
+    
+    try:
+        if orjson is not None:
+            data = orjson.loads(raw)
+        else:
+            from pandas.io.json import ujson_loads
+            data = ujson_loads(raw.decode('utf-8'), precise_float=True)
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Error reading JSON file: {e}")
+    except ValueError as e:
         raise ValueError(f"Invalid JSON format: {e}")
+    
+    try:
+        # A list of records maps straight to rows without pandas' generic
+        # constructor inspecting the input
+        if isinstance(data, list) and all(isinstance(row, dict) for row in data):
+            return pd.DataFrame.from_records(data)
+        return pd.DataFrame(data)
     except Exception as e:
         raise ValueError(f"Error reading JSON file: {e}")
 
@@ -144,7 +220,8 @@ def load_from_api(url: str, params: Optional[dict] = None,
 
 
 def load_to_database(df: pd.DataFrame, db_path: Union[str, Path], 
-                    table_name: str, if_exists: str = 'replace') -> Engine:
+                    table_name: str, if_exists: str = 'replace',
+                    chunksize: Optional[int] = None, bulk: bool = False) -> Engine:
     """
     Load a DataFrame into a SQLite database.
 
@@ -158,6 +235,13 @@ def load_to_database(df: pd.DataFrame, db_path: Union[str, Path],
         Name of the table to create/update.
     if_exists : str, default 'replace'
         How to behave if the table exists: 'fail', 'replace', or 'append'.
+    chunksize : int, optional
+        Number of rows written per batch. By default all rows are written
+        in one batch (1000 rows per batch with ``bulk=True``).
+    bulk : bool, default False
+        If True, write multi-row INSERT statements in a single transaction
+        with ``PRAGMA synchronous = OFF`` for its duration. Intended for
+        reloadable data: if the process dies mid-write, rerun the load.
 
     Returns
     -------
@@ -175,19 +259,43 @@ def load_to_database(df: pd.DataFrame, db_path: Union[str, Path],
     if not table_name or not isinstance(table_name, str):
         raise ValueError("Invalid table name")
     
-    # Create database engine
-    db_path = Path(db_path)
-    engine = create_engine(f'sqlite:///{db_path}')
+    # Shared database engine
+    engine = get_engine(db_path)
+    
+    if not bulk:
+        try:
+            df.to_sql(table_name, engine, if_exists=if_exists, index=False, chunksize=chunksize)
+        finally:
+            invalidate_table_cache(db_path)
+        return engine
     
-    # Load data to database
-    df.to_sql(table_name, engine, if_exists=if_exists, index=False)
+    # Keep each multi-row INSERT under SQLite's bound-parameter limit
+    if chunksize is None:
+        chunksize = 1000
+    chunksize = max(1, min(chunksize, _SQLITE_MAX_VARIABLES // len(df.columns)))
+    
+    with engine.connect() as conn:
+        previous = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+        conn.exec_driver_sql("PRAGMA synchronous = OFF")
+        conn.commit()
+        try:
+            with conn.begin():
+                df.to_sql(table_name, conn, if_exists=if_exists, index=False,
+                          chunksize=chunksize, method='multi')
+        finally:
+            # The connection goes back to the shared pool
+            conn.exec_driver_sql(f"PRAGMA synchronous = {int(previous)}")
+            conn.commit()
+            # The CRUD layer caches table names per database
+            invalidate_table_cache(db_path)
     
     return engine
 
 
 def read_from_database(db_path: Union[str, Path], 
                        table_name: str,
-                       query: Optional[str] = None) -> pd.DataFrame:
+                       query: Optional[str] = None,
+                       engine: str = 'sqlalchemy') -> pd.DataFrame:
     """
     Read data from a SQLite database table.
 
@@ -199,6 +307,11 @@ def read_from_database(db_path: Union[str, Path],
         Name of the table to read from.
     query : str, optional
         SQL query to execute. If None, reads entire table.
+    engine : str, default 'sqlalchemy'
+        Reader to use: 'sqlalchemy' (pandas) or 'connectorx'. ConnectorX
+        reads through Arrow without building Python row objects and, for
+        whole-table reads, splits the table on an integer primary key into
+        one query per CPU. Falls back to pandas if it isn't installed.
 
     Returns
     -------
@@ -210,29 +323,62 @@ def read_from_database(db_path: Union[str, Path],
     FileNotFoundError
         If the database file does not exist.
     ValueError
-        If the table does not exist or query is invalid.
+        If the table does not exist, query is invalid or engine is unknown.
     """
+    if engine not in ('sqlalchemy', 'connectorx'):
+        raise ValueError(f"Unknown engine: {engine}")
+    
     db_path = Path(db_path)
     
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found: {db_path}")
     
-    engine = create_engine(f'sqlite:///{db_path}')
+    sql_engine = get_engine(db_path)
     
     # Check if table exists
-    inspector = inspect(engine)
+    inspector = inspect(sql_engine)
     if table_name not in inspector.get_table_names():
         raise ValueError(f"Table '{table_name}' does not exist in database")
     
+    if engine == 'connectorx':
+        df = _read_with_connectorx(db_path, table_name, query, inspector)
+        if df is not None:
+            return df
+    
     # Read data
     if query:
-        df = pd.read_sql_query(query, engine)
+        df = pd.read_sql_query(query, sql_engine)
     else:
-        df = pd.read_sql_table(table_name, engine)
+        df = pd.read_sql_table(table_name, sql_engine)
     
     return df
 
 
+def _read_with_connectorx(db_path: Path, table_name: str, query: Optional[str],
+                          inspector) -> Optional[pd.DataFrame]:
+    """
+    Read a table or query with ConnectorX; None if it isn't installed.
+    """
+    try:
+        import connectorx as cx
+    except ImportError:
+        return None
+    
+    conn_str = f"sqlite://{db_path.resolve().as_posix()}"
+    if query:
+        return cx.read_sql(conn_str, query, return_type="pandas")
+    
+    # Partition whole-table reads on a single integer primary key
+    pk = inspector.get_pk_constraint(table_name).get('constrained_columns', [])
+    int_cols = {col['name'] for col in inspector.get_columns(table_name)
+                if 'INT' in str(col['type']).upper()}
+    full_query = f'SELECT * FROM "{table_name}"'
+    if len(pk) == 1 and pk[0] in int_cols:
+        return cx.read_sql(conn_str, full_query, return_type="pandas",
+                           partition_on=pk[0], partition_num=os.cpu_count() or 1)
+    return cx.read_sql(conn_str, full_query, return_type="pandas")
+
+
 def main() -> None:
     """
     Placeholder CLI entry point.
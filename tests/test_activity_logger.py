@@ -451,3 +451,107 @@ def test_activity_logger_auto_log_session(tmp_path: Path) -> None:
     assert activities[1]['action'] == 'user_action'
     assert activities[2]['action'] == 'session_end'
 
+
+
+def test_background_logger_writes_after_flush(tmp_path: Path) -> None:
+    """
+    Test that a background logger writes every record, in order, by flush().
+    """
+    log_file = tmp_path / "activity.log"
+    logger = ActivityLogger(log_file, background=True)
+    
+    for i in range(50):
+        logger.log("user_action", f"Action {i}")
+    logger.flush()
+    
+    activities = read_activity_log(log_file)
+    assert [a['description'] for a in activities] == [f"Action {i}" for i in range(50)]
+    
+    logger.close()
+    logger.log("after_close", "Written directly once the writer has stopped")
+    assert read_activity_log(log_file)[-1]['action'] == "after_close"
+
+
+def test_background_logger_bounded_queue_keeps_every_record(tmp_path: Path,
+                                                            monkeypatch) -> None:
+    """
+    Test that a full background queue makes log() wait rather than drop records.
+    """
+    import src.activity_logger as activity_logger
+    monkeypatch.setattr(activity_logger, "QUEUE_MAXSIZE", 2)
+    
+    log_file = tmp_path / "activity.log"
+    logger = ActivityLogger(log_file, background=True)
+    assert logger._queue.maxsize == 2
+    
+    for i in range(200):
+        logger.log("user_action", f"Action {i}")
+    logger.close()
+    
+    assert len(read_activity_log(log_file)) == 200
+
+
+def test_read_activity_log_tail(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that tail reads return the last records across block boundaries.
+    """
+    import src.activity_logger as activity_logger
+    monkeypatch.setattr(activity_logger, "_TAIL_BLOCK_SIZE", 64)
+    
+    log_file = tmp_path / "activity.log"
+    logger = ActivityLogger(log_file)
+    for i in range(30):
+        logger.log("user_action", f"Action {i}")
+    with open(log_file, 'a', encoding='utf-8') as f:
+        f.write("not json\n\n")
+    
+    full = read_activity_log(log_file)
+    assert read_activity_log(log_file, tail=5) == full[-5:]
+    assert read_activity_log(log_file, tail=100) == full
+    assert read_activity_log(log_file, tail=0) == []
+    assert read_activity_log(tmp_path / "missing.log", tail=5) == []
+
+
+def test_export_log_to_csv_with_metadata(tmp_path: Path) -> None:
+    """
+    Test CSV export with metadata serialized and malformed lines skipped.
+    """
+    log_file = tmp_path / "activity.log"
+    logger = ActivityLogger(log_file)
+    logger.log("data_loaded", "Loaded, with a comma", metadata={'file': 'test.csv'})
+    with open(log_file, 'a', encoding='utf-8') as f:
+        f.write("not json\n")
+    logger.log("data_filtered", "Filtered data")
+    
+    csv_file = tmp_path / "out" / "activity_export.csv"
+    export_log_to_csv(log_file, csv_file, include_metadata=True)
+    
+    import pandas as pd
+    df = pd.read_csv(csv_file, keep_default_na=False)
+    
+    assert list(df.columns) == ['timestamp', 'user', 'action', 'description',
+                                'level', 'metadata']
+    assert df['description'].tolist() == ["Loaded, with a comma", "Filtered data"]
+    assert json.loads(df.loc[0, 'metadata']) == {'file': 'test.csv'}
+    assert df.loc[1, 'metadata'] == ''
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_log_round_trip_with_and_without_orjson(tmp_path: Path, monkeypatch,
+                                                use_orjson: bool) -> None:
+    """
+    Test that records survive a write/read cycle with either JSON backend.
+    """
+    import src.activity_logger as activity_logger
+    if not use_orjson:
+        monkeypatch.setattr(activity_logger, "orjson", None)
+    
+    log_file = tmp_path / "activity.log"
+    logger = ActivityLogger(log_file, user="analyst")
+    logger.log("data_loaded", "Café data", metadata={'rows': 10, 1: 'int key'})
+    
+    activities = read_activity_log(log_file)
+    
+    assert len(activities) == 1
+    assert activities[0]['description'] == "Café data"
+    assert activities[0]['metadata'] == {'rows': 10, '1': 'int key'}
@@ -20,6 +20,7 @@ from src.analysis import (
     get_column_statistics,
     group_and_aggregate,
     calculate_trends,
+    calculate_period_trends,
     calculate_growth_rate,
     calculate_moving_average,
     DataAnalyzer
@@ -193,6 +194,22 @@ def test_filter_by_multiple_criteria() -> None:
     assert all(result['year'] == 2020)
 
 
+def test_filter_by_multiple_criteria_handles_missing_values() -> None:
+    """
+    Test that missing values never match and the index is preserved.
+    """
+    df = pd.DataFrame({
+        'country': ['UK', None, 'UK', 'USA'],
+        'year': pd.array([2020, 2020, None, 2020], dtype='Int64'),
+        'cases': [100, 200, 150, 120]
+    })
+    
+    result = filter_by_multiple_criteria(df, {'country': 'UK', 'year': 2020})
+    
+    assert list(result.index) == [0]
+    assert len(filter_by_multiple_criteria(df, {})) == 4
+
+
 # ==============================================================================
 # Tests for Summary Statistics
 # ==============================================================================
@@ -352,6 +369,46 @@ def test_group_and_aggregate_with_sorting() -> None:
     assert result.iloc[0]['cases'] == 200  # USA first (highest)
 
 
+def test_group_and_aggregate_fast_path_matches_groupby() -> None:
+    """
+    Test the NumPy sum/mean/count path against pandas groupby.
+    """
+    df = pd.DataFrame({
+        'country': ['UK', 'USA', 'UK', None, 'France', 'USA'],
+        'cases': [100, 200, 150, 90, 120, 180],
+        'rate': [0.5, 0.25, 0.75, 0.1, 0.4, 0.35]
+    })
+    
+    for column in ['cases', 'rate']:
+        for func in ['sum', 'mean', 'count']:
+            result = group_and_aggregate(df, 'country', column, func)
+            expected = df.groupby('country')[column].agg(func)
+            
+            assert list(result.index) == list(expected.index)
+            assert result[column].dtype == expected.dtype
+            np.testing.assert_allclose(result[column].to_numpy(), expected.to_numpy())
+
+
+def test_group_and_aggregate_polars_backend_matches_pandas() -> None:
+    """
+    Test the polars backend (or its pandas fallback) gives the same result.
+    """
+    df = pd.DataFrame({
+        'country': ['UK', 'USA', 'UK', 'USA', 'France'],
+        'cases': [100, 200, 150, 180, 120]
+    })
+    
+    expected = group_and_aggregate(df, 'country', 'cases', 'sum', sort_by='cases', ascending=False)
+    result = group_and_aggregate(df, 'country', 'cases', 'sum', sort_by='cases',
+                                 ascending=False, backend='polars')
+    
+    assert list(result.index) == list(expected.index)
+    assert list(result['cases']) == list(expected['cases'])
+    
+    with pytest.raises(ValueError):
+        group_and_aggregate(df, 'country', 'cases', backend='dask')
+
+
 # ==============================================================================
 # Tests for Trend Analysis
 # ==============================================================================
@@ -374,6 +431,40 @@ def test_calculate_trends_over_time() -> None:
     assert trends['percent_change'] > 0
 
 
+def test_calculate_period_trends_by_group() -> None:
+    """
+    Test per-group period trends and per-period ranks.
+    """
+    df = pd.DataFrame({
+        'country': ['UK', 'UK', 'UK', 'USA', 'USA'],
+        'year': [2020, 2020, 2021, 2020, 2021],
+        'cases': [50, 50, 150, 200, 300]
+    })
+    
+    result = calculate_period_trends(df, 'year', 'cases', group_column='country')
+    
+    uk = result[result['country'] == 'UK']
+    assert uk['cases'].tolist() == [100, 150]
+    assert uk['growth_rate'].iloc[1] == 50.0
+    assert pd.isna(uk['change'].iloc[0])
+    assert result[result['year'] == 2021].set_index('country')['rank'].to_dict() == {'UK': 2, 'USA': 1}
+
+
+def test_calculate_period_trends_monthly_dates() -> None:
+    """
+    Test that datetime columns are bucketed by month.
+    """
+    df = pd.DataFrame({
+        'date': pd.to_datetime(['2021-01-05', '2021-01-20', '2021-02-03']),
+        'cases': [10, 30, 60]
+    })
+    
+    result = calculate_period_trends(df, 'date', 'cases')
+    
+    assert result['cases'].tolist() == [40, 60]
+    assert result['growth_rate'].iloc[1] == 50.0
+
+
 def test_calculate_growth_rate() -> None:
     """
     Test calculating growth rate between periods.
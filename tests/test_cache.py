@@ -0,0 +1,54 @@
+"""
+Tests for the Feather dataset cache.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.cache import _cache_path, load_or_feather
+
+
+def test_load_or_feather_returns_source_data(tmp_path: Path) -> None:
+    """
+    Test that Feather-cached loads return the source data from a separate cache dir.
+    """
+    csv_path = tmp_path / "health_data.csv"
+    csv_path.write_text("country,year,cases\nUK,2020,100\nFrance,2021,150\n")
+    cache_dir = tmp_path / "cache"
+
+    first = load_or_feather(csv_path, cache_dir=cache_dir)
+    second = load_or_feather(csv_path, cache_dir=cache_dir)
+
+    pd.testing.assert_frame_equal(first, second, check_dtype=False)
+    assert list(second.columns) == ["country", "year", "cases"]
+    assert list(tmp_path.glob("*.feather")) == []
+
+
+def test_load_or_feather_ignores_cache_of_replaced_source(tmp_path: Path) -> None:
+    """
+    Test that a source replaced by an older file is re-read, per loader variant.
+    """
+    csv_path = tmp_path / "health_data.csv"
+    csv_path.write_text("country,cases\nUK,100\n")
+    cache_dir = tmp_path / "cache"
+    load_or_feather(csv_path, cache_dir=cache_dir)
+
+    old_key = _cache_path(csv_path, cache_dir)
+    csv_path.write_text("country,cases\nFrance,150\nSpain,90\n")
+    os.utime(csv_path, ns=(1_000_000_000, 1_000_000_000))
+
+    assert _cache_path(csv_path, cache_dir) != old_key
+    assert _cache_path(csv_path, cache_dir, "fast") != _cache_path(csv_path, cache_dir)
+    df = load_or_feather(csv_path, cache_dir=cache_dir)
+    assert df["country"].tolist() == ["France", "Spain"]
+
+
+def test_load_or_feather_raises_for_missing_file(tmp_path: Path) -> None:
+    """
+    Test that a missing source file raises FileNotFoundError.
+    """
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        load_or_feather(tmp_path / "missing.csv", cache_dir=tmp_path / "cache")
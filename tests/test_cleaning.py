@@ -475,3 +475,19 @@ def test_data_cleaner_get_cleaning_report() -> None:
     assert report['original_rows'] == 3
     assert report['cleaned_rows'] == 2
 
+
+
+def test_data_cleaner_fused_pipeline_matches_chain() -> None:
+    """
+    Test that the fused pipeline matches chained duplicate and missing removal.
+    """
+    df = pd.DataFrame({
+        'country': ['UK', None, 'UK', 'France', None],
+        'cases': [100, 200, 100, 300, 200]
+    })
+    
+    chained = DataCleaner(df).remove_duplicates().handle_missing(strategy='drop')
+    fused = DataCleaner(df).fused_pipeline()
+    
+    pd.testing.assert_frame_equal(fused.get_cleaned_data(), chained.get_cleaned_data())
+    assert fused.get_cleaning_report() == chained.get_cleaning_report()
@@ -8,21 +8,30 @@ Step 5: Extension Features - CRUD Operations
 import pandas as pd
 import pytest
 from pathlib import Path
-from sqlalchemy import create_engine, inspect
+import sys
+from sqlalchemy import create_engine, inspect, text
 
 from src.crud import (
     create_record,
     create_records,
+    create_records_bulk,
     read_records,
+    count_records,
     read_record_by_id,
     update_record,
     update_records,
     delete_record,
     delete_records,
     get_table_info,
+    column_converters,
+    create_index,
+    indexed_columns,
+    validate_select_query,
     list_tables,
     table_exists,
-    CRUDManager
+    CRUDManager,
+    close_database,
+    _get_engine
 )
 
 
@@ -82,6 +91,63 @@ def test_create_multiple_records(tmp_path: Path) -> None:
     assert len(df_result) == 3
 
 
+def test_create_records_with_uneven_keys(tmp_path: Path) -> None:
+    """
+    Test that keys missing from some records are stored as NULL.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    df = pd.DataFrame({'id': [1], 'country': ['UK'], 'cases': [100]})
+    df.to_sql('health_data', engine, if_exists='replace', index=False)
+    
+    new_records = [
+        {'id': 2, 'country': 'USA'},
+        {'id': 3, 'country': 'France', 'cases': 150}
+    ]
+    create_records(db_path, 'health_data', new_records)
+    
+    df_result = pd.read_sql_table('health_data', engine)
+    assert len(df_result) == 3
+    assert pd.isna(df_result[df_result['id'] == 2].iloc[0]['cases'])
+    assert df_result[df_result['id'] == 3].iloc[0]['cases'] == 150
+
+
+def test_create_records_bulk(tmp_path: Path) -> None:
+    """
+    Test bulk loading records from a generator in several chunks.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    df = pd.DataFrame({'id': [1], 'country': ['UK'], 'cases': [100]})
+    df.to_sql('health_data', engine, if_exists='replace', index=False)
+    
+    records = ({'id': i, 'country': 'USA', 'cases': i} for i in range(2, 27))
+    count = create_records_bulk(db_path, 'health_data', records, chunk_size=10)
+    
+    assert count == 25
+    df_result = pd.read_sql_table('health_data', engine)
+    assert len(df_result) == 26
+    assert df_result['cases'].sum() == 100 + sum(range(2, 27))
+
+
+def test_create_records_with_unknown_column(tmp_path: Path) -> None:
+    """
+    Test that inserting a column the table doesn't have raises ValueError.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    df = pd.DataFrame({'id': [1], 'country': ['UK'], 'cases': [100]})
+    df.to_sql('health_data', engine, if_exists='replace', index=False)
+    
+    with pytest.raises(ValueError):
+        create_records(db_path, 'health_data', [{'id': 2, 'population': 5}])
+    
+    assert len(pd.read_sql_table('health_data', engine)) == 1
+
+
 def test_create_record_with_missing_columns(tmp_path: Path) -> None:
     """
     Test that creating a record with missing required columns raises error.
@@ -154,6 +220,46 @@ def test_read_records_with_filter(tmp_path: Path) -> None:
     assert result.iloc[0]['country'] == 'UK'
 
 
+def test_read_records_backend_fallback(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that Arrow backends fall back to pandas when not installed.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    pd.DataFrame({'id': [1, 2], 'cases': [100, 200]}).to_sql(
+        'health_data', engine, if_exists='replace', index=False
+    )
+    monkeypatch.setitem(sys.modules, 'connectorx', None)
+    monkeypatch.setitem(sys.modules, 'adbc_driver_sqlite', None)
+    
+    for backend in ('connectorx', 'adbc'):
+        result = read_records(db_path, 'health_data', backend=backend)
+        assert len(result) == 2
+    
+    with pytest.raises(ValueError, match="Unknown backend"):
+        read_records(db_path, 'health_data', backend='odbc')
+
+
+def test_read_records_output_types(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test validation of the requested output type.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    pd.DataFrame({'id': [1, 2]}).to_sql('health_data', engine, if_exists='replace', index=False)
+    monkeypatch.setitem(sys.modules, 'polars', None)
+    
+    assert isinstance(read_records(db_path, 'health_data', output='pandas'), pd.DataFrame)
+    
+    with pytest.raises(ImportError):
+        read_records(db_path, 'health_data', output='polars')
+    
+    with pytest.raises(ValueError, match="Unknown output"):
+        read_records(db_path, 'health_data', output='csv')
+
+
 def test_read_record_by_id(tmp_path: Path) -> None:
     """
     Test reading a single record by ID.
@@ -175,6 +281,23 @@ def test_read_record_by_id(tmp_path: Path) -> None:
     assert result['country'] == 'USA'
 
 
+def test_read_record_by_text_id(tmp_path: Path) -> None:
+    """
+    Test that text ID values are bound as parameters, not pasted into SQL.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    df = pd.DataFrame({'code': ['GB', 'US'], 'cases': [100, 200]})
+    df.to_sql('health_data', engine, if_exists='replace', index=False)
+    
+    result = read_record_by_id(db_path, 'health_data', 'code', 'US')
+    
+    assert result['cases'] == 200
+    assert delete_records(db_path, 'health_data', 'code', "GB' OR '1'='1") == 0
+    assert len(read_records(db_path, 'health_data')) == 2
+
+
 def test_read_nonexistent_record_by_id(tmp_path: Path) -> None:
     """
     Test reading non-existent record returns None.
@@ -458,6 +581,29 @@ def test_table_exists(tmp_path: Path) -> None:
     
     assert table_exists(db_path, 'existing_table') is True
     assert table_exists(db_path, 'nonexistent_table') is False
+    
+    # Tables created after the names were cached are still found
+    pd.DataFrame({'id': [1]}).to_sql('new_table', engine, index=False)
+    assert table_exists(db_path, 'new_table') is True
+
+
+def test_dropped_tables_are_not_reported(tmp_path: Path) -> None:
+    """
+    Test that tables dropped after the names were cached are not reported.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    pd.DataFrame({'id': [1]}).to_sql('old_table', engine, index=False)
+    assert list_tables(db_path) == ['old_table']
+    
+    with engine.begin() as conn:
+        conn.execute(text('DROP TABLE old_table'))
+    
+    assert list_tables(db_path) == []
+    assert table_exists(db_path, 'old_table') is False
+    with pytest.raises(ValueError, match="does not exist"):
+        read_records(db_path, 'old_table')
 
 
 def test_get_table_info(tmp_path: Path) -> None:
@@ -482,6 +628,75 @@ def test_get_table_info(tmp_path: Path) -> None:
     assert 'row_count' in info
     assert len(info['columns']) == 4
     assert info['row_count'] == 2
+    assert info['columns'][1] == {'name': 'country', 'type': 'TEXT'}
+    
+    estimate = get_table_info(db_path, 'health_data', exact=False)
+    assert estimate['row_count'] == 2
+
+
+def test_engine_reused_for_same_database(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that repeated calls for the same database share one engine.
+    """
+    db_path = tmp_path / "test.db"
+    monkeypatch.chdir(tmp_path)
+    
+    assert _get_engine(db_path) is _get_engine("test.db")
+    assert _get_engine(db_path) is not _get_engine(tmp_path / "other.db")
+
+
+def test_engine_uses_wal_mode(tmp_path: Path) -> None:
+    """
+    Test the CRUD engine enables WAL journaling.
+    """
+    engine = _get_engine(tmp_path / "test.db")
+    
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == 'wal'
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+
+
+def test_engine_connections_are_not_shared(tmp_path: Path) -> None:
+    """
+    Test that CRUD calls neither see nor end another connection's transaction.
+    """
+    db_path = tmp_path / "test.db"
+    engine = _get_engine(db_path)
+    pd.DataFrame({'id': [1]}).to_sql('table1', engine, index=False)
+    
+    with engine.connect() as conn:
+        conn.execute(text("INSERT INTO table1 (id) VALUES (2)"))
+        assert count_records(db_path, 'table1') == 1
+        conn.commit()
+    
+    assert count_records(db_path, 'table1') == 2
+
+
+def test_close_database_reconnects_on_next_call(tmp_path: Path) -> None:
+    """
+    Test that CRUD calls keep working after the pooled connections are closed.
+    """
+    db_path = tmp_path / "test.db"
+    pd.DataFrame({'id': [1]}).to_sql('table1', _get_engine(db_path), index=False)
+    
+    close_database(db_path)
+    create_record(db_path, 'table1', {'id': 2})
+    
+    assert read_records(db_path, 'table1')['id'].tolist() == [1, 2]
+
+
+def test_table_created_after_validation_is_found(tmp_path: Path) -> None:
+    """
+    Test that a table created by another connection is seen right away.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    pd.DataFrame({'id': [1]}).to_sql('table1', engine, if_exists='replace', index=False)
+    assert len(read_records(db_path, 'table1')) == 1
+    
+    pd.DataFrame({'id': [1, 2]}).to_sql('table2', engine, if_exists='replace', index=False)
+    assert len(read_records(db_path, 'table2')) == 2
 
 
 # ==============================================================================
@@ -544,6 +759,61 @@ def test_crud_manager_update_and_delete(tmp_path: Path) -> None:
     assert len(result) == 1
 
 
+def test_crud_manager_batch_insert(tmp_path: Path) -> None:
+    """
+    Test buffered inserts are written on flush and rolled back on error.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    pd.DataFrame({'id': [1], 'country': ['UK'], 'cases': [100]}).to_sql(
+        'health_data', engine, if_exists='replace', index=False
+    )
+    
+    manager = CRUDManager(db_path)
+    
+    with manager.batch_insert('health_data', flush_every=2) as batch:
+        for i in range(2, 7):
+            batch.add({'id': i, 'country': 'USA', 'cases': i * 10})
+    
+    assert batch.count == 5
+    assert len(manager.read('health_data')) == 6
+    
+    with pytest.raises(RuntimeError):
+        with manager.batch_insert('health_data', flush_every=2) as batch:
+            for i in range(7, 10):
+                batch.add({'id': i, 'country': 'France', 'cases': i})
+            raise RuntimeError("abort")
+    
+    assert len(manager.read('health_data')) == 6
+
+
+def test_batch_insert_survives_interleaved_crud_calls(tmp_path: Path) -> None:
+    """
+    Test that CRUD reads during a batch neither see nor end its transaction.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    pd.DataFrame({'id': [1], 'country': ['UK'], 'cases': [100]}).to_sql(
+        'health_data', engine, if_exists='replace', index=False
+    )
+    
+    manager = CRUDManager(db_path)
+    
+    with manager.batch_insert('health_data', flush_every=2) as batch:
+        batch.add({'id': 2, 'country': 'USA', 'cases': 20})
+        batch.add({'id': 3, 'country': 'USA', 'cases': 30})
+        
+        # The first two records are flushed but not committed yet
+        assert count_records(db_path, 'health_data') == 1
+        assert read_records(db_path, 'health_data')['id'].tolist() == [1]
+        
+        batch.add({'id': 4, 'country': 'USA', 'cases': 40})
+    
+    assert read_records(db_path, 'health_data')['id'].tolist() == [1, 2, 3, 4]
+
+
 def test_crud_manager_get_tables(tmp_path: Path) -> None:
     """
     Test CRUDManager listing tables.
@@ -575,3 +845,165 @@ def test_crud_manager_table_exists(tmp_path: Path) -> None:
     assert manager.table_exists('existing') is True
     assert manager.table_exists('nonexistent') is False
 
+
+
+def test_read_records_with_params_and_columns(tmp_path: Path) -> None:
+    """
+    Test reading records with bound WHERE parameters and a column subset.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    df = pd.DataFrame({
+        'id': [1, 2, 3],
+        'country': ['UK', 'USA', 'UK'],
+        'cases': [100, 200, 150]
+    })
+    df.to_sql('health_data', engine, if_exists='replace', index=False)
+    
+    result = read_records(db_path, 'health_data', where="country = :c",
+                          params={'c': 'UK'}, columns=['id', 'cases'],
+                          order_by='id DESC', limit=1)
+    
+    assert list(result.columns) == ['id', 'cases']
+    assert result['id'].tolist() == [3]
+
+
+def test_count_records(tmp_path: Path) -> None:
+    """
+    Test counting records with and without a WHERE clause.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    df = pd.DataFrame({'id': range(25), 'cases': range(0, 250, 10)})
+    df.to_sql('health_data', engine, if_exists='replace', index=False)
+    
+    assert count_records(db_path, 'health_data') == 25
+    assert count_records(db_path, 'health_data', where="cases >= 100") == 15
+    assert count_records(db_path, 'health_data', where="id < :n",
+                         params={'n': 5}) == 5
+    
+    with pytest.raises(ValueError):
+        count_records(db_path, 'missing_table')
+
+
+def test_column_converters() -> None:
+    """
+    Test that converters follow the declared column types.
+    """
+    converters = column_converters([
+        {'name': 'id', 'type': 'INTEGER'},
+        {'name': 'rate', 'type': 'REAL'},
+        {'name': 'ratio', 'type': 'float'},
+        {'name': 'country', 'type': 'TEXT'},
+    ])
+    
+    assert converters['id']("42") == 42
+    assert converters['id']("n/a") == "n/a"
+    assert converters['rate']("1.5") == 1.5
+    assert converters['ratio']("2") == 2.0
+    assert converters['country']("007") == "007"
+
+
+def test_update_record_with_spaced_column_and_params(tmp_path: Path) -> None:
+    """
+    Test updating several columns, one with a space, in a single statement.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    df = pd.DataFrame({
+        'id': [1, 2],
+        'country': ['UK', 'USA'],
+        'total cases': [100, 200]
+    })
+    df.to_sql('health_data', engine, if_exists='replace', index=False)
+    
+    rows_affected = update_record(db_path, 'health_data',
+                                  {'total cases': 150, 'country': 'France'},
+                                  where="country = :country", params={'country': 'UK'})
+    
+    result = read_records(db_path, 'health_data', order_by='id')
+    assert rows_affected == 1
+    assert result['country'].tolist() == ['France', 'USA']
+    assert result['total cases'].tolist() == [150, 200]
+
+
+def test_create_index_and_indexed_columns(tmp_path: Path) -> None:
+    """
+    Test creating a single-column index and listing indexed columns.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    df = pd.DataFrame({'id': [1, 2], 'country': ['UK', 'USA']})
+    df.to_sql('health_data', engine, if_exists='replace', index=False)
+    
+    assert indexed_columns(db_path, 'health_data') == frozenset()
+    
+    index_name = create_index(db_path, 'health_data', 'country')
+    # Creating it again is a no-op
+    assert create_index(db_path, 'health_data', 'country') == index_name
+    
+    assert index_name == 'ix_health_data_country'
+    assert indexed_columns(db_path, 'health_data') == frozenset({'country'})
+
+
+def test_read_records_dtype_backend(tmp_path: Path) -> None:
+    """
+    Test reading records with nullable and (optional) Arrow-backed dtypes.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    
+    df = pd.DataFrame({'id': [1, 2], 'cases': [100.0, None]})
+    df.to_sql('health_data', engine, if_exists='replace', index=False)
+    
+    result = read_records(db_path, 'health_data', dtype_backend='numpy_nullable')
+    assert str(result['id'].dtype) == 'Int64'
+    assert result['cases'].isna().tolist() == [False, True]
+    
+    # Falls back to default dtypes when pyarrow is missing
+    result = read_records(db_path, 'health_data', dtype_backend='pyarrow')
+    assert result['id'].tolist() == [1, 2]
+    
+    with pytest.raises(ValueError, match="Unknown dtype_backend"):
+        read_records(db_path, 'health_data', dtype_backend='arrow')
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT * FROM health_data",
+    "SELECT country, COUNT(*) FROM health_data GROUP BY country;",
+    "WITH uk AS (SELECT * FROM health_data WHERE country = 'UK') SELECT * FROM uk",
+])
+def test_validate_select_query_accepts_reads(tmp_path: Path, query: str) -> None:
+    """
+    Test that single read-only statements pass the SELECT guard.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    pd.DataFrame({'id': [1], 'country': ['UK']}).to_sql('health_data', engine, index=False)
+    
+    validate_select_query(db_path, query)
+
+
+@pytest.mark.parametrize("query", [
+    "DELETE FROM health_data",
+    "SELECT 1; DROP TABLE health_data",
+    "WITH x AS (SELECT 1) DELETE FROM health_data",
+    "PRAGMA writable_schema = 1",
+    "SELEC * FROM health_data",
+])
+def test_validate_select_query_rejects_writes(tmp_path: Path, query: str) -> None:
+    """
+    Test that writes, multiple statements and invalid SQL are rejected unexecuted.
+    """
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f'sqlite:///{db_path}')
+    pd.DataFrame({'id': [1], 'country': ['UK']}).to_sql('health_data', engine, index=False)
+    
+    with pytest.raises(ValueError, match="Only single SELECT"):
+        validate_select_query(db_path, query)
+    
+    assert len(read_records(db_path, 'health_data')) == 1
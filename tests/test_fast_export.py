@@ -0,0 +1,55 @@
+"""
+Tests for the streaming export module.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from src.fast_export import stream_to_csv, stream_to_database
+from src.main import read_from_database
+
+
+def test_stream_to_csv_round_trips_in_chunks(tmp_path: Path) -> None:
+    """
+    Test that a chunked export matches the original data with one header.
+    """
+    df = pd.DataFrame({
+        'country': ['UK', 'USA', 'France', 'Germany', 'Spain'],
+        'cases': [100, 200, 150, 180, 120]
+    })
+    output_file = tmp_path / "out" / "export.csv"
+
+    rows = stream_to_csv(df, output_file, chunksize=2)
+
+    assert rows == 5
+    pd.testing.assert_frame_equal(pd.read_csv(output_file), df, check_dtype=False)
+
+
+def test_stream_to_csv_empty_frame_writes_header(tmp_path: Path) -> None:
+    """
+    Test that exporting an empty frame still writes the column header.
+    """
+    output_file = tmp_path / "empty.csv"
+
+    stream_to_csv(pd.DataFrame(columns=['country', 'cases']), output_file)
+
+    assert output_file.read_text().strip() == "country,cases"
+
+
+def test_stream_to_database_round_trips_with_nulls(tmp_path: Path) -> None:
+    """
+    Test that a batched database export keeps values and stores NaN as NULL.
+    """
+    df = pd.DataFrame({
+        'country': ['UK', 'USA', None, 'Germany', 'Spain'],
+        'cases': [100, 200, 150, 180, 120],
+        'rate': [0.1, None, 0.3, 0.4, 0.5]
+    })
+    db_path = tmp_path / "export.db"
+
+    rows = stream_to_database(df, db_path, "cases", chunksize=2)
+
+    assert rows == 5
+    result = read_from_database(db_path, "cases")
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
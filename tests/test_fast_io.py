@@ -0,0 +1,43 @@
+"""
+Tests for the optional fast CSV loading module.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.fast_io import fast_io_enabled, read_csv_fast
+
+
+def test_read_csv_fast_returns_dataframe(tmp_path: Path) -> None:
+    """
+    Test that the fast reader loads the same rows and columns as pandas.
+    """
+    csv_path = tmp_path / "health_data.csv"
+    csv_path.write_text("country,year,cases\nUK,2020,100\nUK,2021,150\n")
+
+    df = read_csv_fast(csv_path)
+
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns) == ["country", "year", "cases"]
+    assert df["cases"].sum() == 250
+
+
+def test_read_csv_fast_raises_for_missing_file(tmp_path: Path) -> None:
+    """
+    Test that a missing file raises FileNotFoundError.
+    """
+    with pytest.raises(FileNotFoundError):
+        read_csv_fast(tmp_path / "missing.csv")
+
+
+def test_fast_io_enabled_reads_environment(monkeypatch) -> None:
+    """
+    Test the HEALTH_FAST_IO flag.
+    """
+    monkeypatch.delenv("HEALTH_FAST_IO", raising=False)
+    assert fast_io_enabled() is False
+
+    monkeypatch.setenv("HEALTH_FAST_IO", "1")
+    assert fast_io_enabled() is True
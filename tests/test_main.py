@@ -5,6 +5,7 @@ Following TDD, these tests come before the full implementation.
 """
 
 import json
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -17,7 +18,9 @@ from src.main import (
     load_json_dataset,
     load_from_api,
     load_to_database,
-    read_from_database
+    read_from_database,
+    get_engine,
+    dispose_engines
 )
 
 
@@ -84,6 +87,18 @@ def test_load_dataset_handles_various_data_types(tmp_path: Path) -> None:
     assert df['rate'].dtype == 'float64'
 
 
+def test_load_dataset_fast_matches_default(tmp_path: Path) -> None:
+    """
+    Test that the fast parser path returns the same data as the default one.
+    """
+    csv_path = tmp_path / "fast_data.csv"
+    csv_path.write_text("country,year,cases\nUK,2020,100\nUK,2021,150\n")
+
+    fast = load_dataset(csv_path, fast=True)
+
+    pd.testing.assert_frame_equal(fast, load_dataset(csv_path), check_dtype=False)
+
+
 # ==============================================================================
 # Tests for JSON Loading (load_json_dataset)
 # ==============================================================================
@@ -107,6 +122,22 @@ def test_load_json_dataset_returns_dataframe(tmp_path: Path) -> None:
     assert list(df.columns) == ["country", "year", "cases"]
 
 
+def test_load_json_dataset_without_orjson(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that JSON loading falls back to the bundled parser without orjson.
+    """
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    json_path = tmp_path / "health_data.json"
+    json_path.write_text('[{"country": "UK", "rate": 0.1}, {"country": "USA", "rate": 0.25}]')
+
+    df = load_json_dataset(json_path)
+
+    assert df["rate"].tolist() == [0.1, 0.25]
+    with pytest.raises(ValueError, match="Invalid JSON format"):
+        json_path.write_text("{invalid json content")
+        load_json_dataset(json_path)
+
+
 def test_load_json_dataset_raises_for_missing_file(tmp_path: Path) -> None:
     """
     Test that load_json_dataset raises FileNotFoundError for missing files.
@@ -284,6 +315,40 @@ def test_load_to_database_raises_for_invalid_table_name(tmp_path: Path) -> None:
         load_to_database(df, db_path, "")
 
 
+def test_load_to_database_bulk_round_trips(tmp_path: Path) -> None:
+    """
+    Test that a bulk load stores the same rows and restores the pragma.
+    """
+    df = pd.DataFrame({
+        "country": ["UK", "USA", None] * 700,
+        "year": [2020, 2021, 2022] * 700,
+        "cases": [100.5, None, 150.0] * 700
+    })
+    db_path = tmp_path / "test_health.db"
+    
+    engine = load_to_database(df, db_path, "health_data", bulk=True)
+    
+    pd.testing.assert_frame_equal(read_from_database(db_path, "health_data"), df)
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() != 0
+
+
+def test_load_to_database_refreshes_crud_table_cache(tmp_path: Path) -> None:
+    """
+    Test that CRUD calls see a table replaced by load_to_database.
+    """
+    from src.crud import create_records_bulk, read_records
+    
+    db_path = tmp_path / "test_health.db"
+    load_to_database(pd.DataFrame({"id": [1], "cases": [10]}), db_path, "health_data")
+    create_records_bulk(db_path, "health_data", [{"id": 2, "cases": 20}])
+    
+    load_to_database(pd.DataFrame({"id": [3]}), db_path, "health_data")
+    
+    assert create_records_bulk(db_path, "health_data", [{"id": 4}]) == 1
+    assert read_records(db_path, "health_data")["id"].tolist() == [3, 4]
+
+
 def test_read_from_database_success(tmp_path: Path) -> None:
     """
     Test successfully reading data from database.
@@ -325,6 +390,38 @@ def test_read_from_database_with_query(tmp_path: Path) -> None:
     assert df_filtered.iloc[0]["country"] == "UK"
 
 
+def test_read_from_database_connectorx_engine(tmp_path: Path) -> None:
+    """
+    Test the connectorx engine (or its pandas fallback) reads the table.
+    """
+    df = pd.DataFrame({"country": ["UK", "France"], "year": [2020, 2020]})
+    db_path = tmp_path / "test.db"
+    load_to_database(df, db_path, "health_data")
+
+    df_read = read_from_database(db_path, "health_data", engine="connectorx")
+
+    assert len(df_read) == 2
+    assert set(df_read["country"]) == {"UK", "France"}
+
+    with pytest.raises(ValueError):
+        read_from_database(db_path, "health_data", engine="odbc")
+
+
+def test_get_engine_is_shared_per_database(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that engines are reused per database until disposed.
+    """
+    monkeypatch.chdir(tmp_path)
+    db_path = tmp_path / "test.db"
+
+    engine = get_engine(db_path)
+    assert get_engine("test.db") is engine
+    assert load_to_database(pd.DataFrame({"a": [1]}), db_path, "t") is engine
+
+    dispose_engines()
+    assert get_engine(db_path) is not engine
+
+
 def test_read_from_database_raises_for_missing_db(tmp_path: Path) -> None:
     """
     Test that read_from_database raises FileNotFoundError for missing database.